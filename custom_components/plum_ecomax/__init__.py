@@ -4,8 +4,9 @@ This module handles the setup, configuration, and unloading of the
 integration through Home Assistant's Config Flow.
 """
 import logging
-import asyncio
 import os
+from functools import lru_cache
+from typing import Final
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_IP_ADDRESS, CONF_PASSWORD, CONF_PORT
@@ -14,7 +15,24 @@ from .coordinator import PlumDataUpdateCoordinator
 from .plum_device import PlumDevice
 
 _LOGGER = logging.getLogger(__name__)
-PLATFORMS = ["climate", "sensor", "number", "switch", "select", "water_heater", "calendar"]
+PLATFORMS: Final[tuple[str, ...]] = (
+    "climate", "sensor", "number", "switch", "select", "water_heater", "calendar",
+)
+
+MAP_FILENAME = "device_map_ecomax360i.json"
+
+@lru_cache(maxsize=8)
+def _map_path(config_dir: str, filename: str) -> str:
+    """Returns the path of a device map shipped with the integration.
+
+    Args:
+        config_dir: The Home Assistant configuration directory.
+        filename: The device map file name.
+
+    Returns:
+        str: The absolute path of the map file.
+    """
+    return os.path.join(config_dir, "custom_components", DOMAIN, filename)
 
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the Plum EcoMAX component.
@@ -46,12 +64,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     port = entry.data.get(CONF_PORT, DEFAULT_PORT)
     password = entry.data.get(CONF_PASSWORD, "0000")
     
-    filename = "device_map_ecomax360i.json"
-    json_path = hass.config.path(f"custom_components/{DOMAIN}/{filename}")
+    json_path = _map_path(hass.config.config_dir, MAP_FILENAME)
     
     device = PlumDevice(ip, port=port, password=password, map_file=json_path)
     
-    await asyncio.to_thread(device.load_map)
+    await device.async_load_map()
 
     coordinator = PlumDataUpdateCoordinator(hass, device)
     
@@ -74,5 +91,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
         bool: True if the entry was successfully unloaded.
     """
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.invalidate_cache()
+        await coordinator.device.async_close()
     return unload_ok
\ No newline at end of file
@@ -1,6 +1,9 @@
 import logging
 import datetime
-from typing import Any, List, Optional
+import sys
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, List, Optional, Tuple
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.core import HomeAssistant
@@ -13,6 +16,66 @@ from .const import DOMAIN, WEEKDAY_TO_SLUGS, CONF_ACTIVE_CIRCUITS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Duration of one schedule slot
+_SLOT = datetime.timedelta(minutes=30)
+
+# Slots 1-47 of a day; slot 0 always opens the first event
+_TRANSITION_MASK = ((1 << 48) - 1) & ~1
+
+@lru_cache(maxsize=128)
+def _scan_day(val_am: int, val_pm: int) -> Tuple[Tuple[int, int, bool], ...]:
+    """Splits a day's AM/PM bitmasks into runs of identical slots.
+
+    Schedules repeat every week, so the few distinct register pairs are
+    memoized and each is only scanned once.
+
+    Args:
+        val_am: Integer value of the AM register (00:00-12:00).
+        val_pm: Integer value of the PM register (12:00-00:00).
+
+    Returns:
+        Tuple[Tuple[int, int, bool], ...]: (start_slot, end_slot, is_active) runs.
+    """
+    # One bit per half-hour slot: bit i is slot i (00:00 + i * 30 min)
+    bits = (val_am & 0xFFFFFF) | ((val_pm & 0xFFFFFF) << 24)
+
+    # Bit i of `trans` is set when slot i differs from slot i - 1
+    trans = (bits ^ (bits << 1)) & _TRANSITION_MASK
+
+    runs = []
+    start = 0
+    while trans:
+        lsb = trans & -trans
+        end = lsb.bit_length() - 1
+        runs.append((start, end, bool((bits >> start) & 1)))
+        start = end
+        trans ^= lsb
+
+    runs.append((start, 48, bool((bits >> start) & 1)))
+    return tuple(runs)
+
+_ALL_ECO = ((0, 48, False),)
+_ALL_ACTIVE = ((0, 48, True),)
+
+def _day_runs(val_am: int, val_pm: int) -> Tuple[Tuple[int, int, bool], ...]:
+    """Returns the runs of a day, short-circuiting uniform schedules.
+
+    Args:
+        val_am: Integer value of the AM register (00:00-12:00).
+        val_pm: Integer value of the PM register (12:00-00:00).
+
+    Returns:
+        Tuple[Tuple[int, int, bool], ...]: (start_slot, end_slot, is_active) runs.
+    """
+    # Uniform day (all Eco or all Active): a single event, no scan
+    val_am &= 0xFFFFFF
+    if val_am == val_pm & 0xFFFFFF:
+        if val_am == 0:
+            return _ALL_ECO
+        if val_am == 0xFFFFFF:
+            return _ALL_ACTIVE
+    return _scan_day(val_am, val_pm)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: Any,
@@ -27,15 +90,17 @@ async def async_setup_entry(
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
     selected_circuits = entry.data.get(CONF_ACTIVE_CIRCUITS, [])
-    entities = []
+    keys = coordinator.device.params_keys
 
     # 1. Circuit's calendar
-    for circuit_id in selected_circuits:
-        if f"circuit{circuit_id}mondayam" in coordinator.device.params_map:
-            entities.append(PlumEconetCalendar(coordinator, entry, "circuit", circuit_id))
+    entities = [
+        PlumEconetCalendar(coordinator, entry, "circuit", circuit_id)
+        for circuit_id in selected_circuits
+        if f"circuit{circuit_id}mondayam" in keys
+    ]
 
     # 2. HDW's calendar
-    if "hdwmondayam" in coordinator.device.params_map:
+    if "hdwmondayam" in keys:
         entities.append(PlumEconetCalendar(coordinator, entry, "hdw", 0))
 
     async_add_entities(entities)
@@ -64,12 +129,34 @@ class PlumEconetCalendar(CoordinatorEntity, CalendarEntity):
         self._index = index
         self._event = None
 
+        # (AM slug, PM slug) of each weekday, indexed by date.weekday()
+        prefix = f"circuit{index}" if system_type == "circuit" else "hdw"
+        self._slug_by_weekday = [
+            (sys.intern(f"{prefix}{suffix_am}"), sys.intern(f"{prefix}{suffix_pm}"))
+            for _, (suffix_am, suffix_pm) in sorted(WEEKDAY_TO_SLUGS.items())
+        ]
+        self._weekday_getters = [itemgetter(*slugs) for slugs in self._slug_by_weekday]
+
+        # Links the calendar to the circuit or HDW device registry entry
         if self._system_type == "circuit":
             self._attr_name = f"Calendar Circuit {index}"
             self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_calendar_circuit_{index}"
+            self._attr_device_info = DeviceInfo(
+                identifiers={(DOMAIN, f"{self._entry_id}_circuit_{self._index}")},
+                name=f"Circuit {self._index}",
+                manufacturer="Plum",
+                via_device=(DOMAIN, self._entry_id),
+            )
         else:
             self._attr_name = "DHW Calendar"
             self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_calendar_hdw"
+            self._attr_device_info = DeviceInfo(
+                identifiers={(DOMAIN, "plum_hdw")},
+                name="HDW",
+                manufacturer="Plum",
+                model="HDW Monitor",
+                via_device=(DOMAIN, self._entry_id),
+            )
 
     @property
     def event(self) -> CalendarEvent | None:
@@ -93,76 +180,50 @@ class PlumEconetCalendar(CoordinatorEntity, CalendarEntity):
         Returns:
             List[CalendarEvent]: A list of calendar events found within the range.
         """
-        events = []
-        current_day = start_date
-        
-        while current_day <= end_date:
-            weekday = current_day.weekday()
-            slugs = WEEKDAY_TO_SLUGS.get(weekday)
-            
-            if not slugs: 
-                current_day += datetime.timedelta(days=1)
+        if end_date < start_date:
+            return []
+
+        data = self.coordinator.data
+        one_day = datetime.timedelta(days=1)
+        n_days = (end_date - start_date) // one_day + 1
+
+        # Schedules are local wall-clock times: convert once, then every event
+        # is an offset from a local midnight
+        first_midnight = dt_util.as_local(start_date).replace(hour=0, minute=0, second=0, microsecond=0)
+        start_wd = first_midnight.weekday()
+
+        # Decode each weekday of the range once; the day loop below only
+        # turns the runs into events
+        week_runs = [None] * 7
+        for i in range(min(n_days, 7)):
+            weekday = (start_wd + i) % 7
+            try:
+                val_am, val_pm = self._weekday_getters[weekday](data)
+                week_runs[weekday] = _day_runs(int(val_am), int(val_pm))
+            except (KeyError, ValueError, TypeError):
+                # Missing or None register: no events for that weekday
+                pass
+
+        # The runs give the exact event count, so the list is sized up front
+        day_runs = [week_runs[(start_wd + i) % 7] for i in range(n_days)]
+        events = [None] * sum(len(runs) for runs in day_runs if runs is not None)
+
+        pos = 0
+        for i, runs in enumerate(day_runs):
+            if runs is None:
                 continue
+            day_start = first_midnight + i * one_day
+            for start, end, is_active in runs:
+                events[pos] = self._create_event(day_start, start, end, is_active)
+                pos += 1
 
-            suffix_am, suffix_pm = slugs
-            
-            if self._system_type == "circuit":
-                slug_am = f"circuit{self._index}{suffix_am}"
-                slug_pm = f"circuit{self._index}{suffix_pm}"
-            else:
-                slug_am = f"hdw{suffix_am}"
-                slug_pm = f"hdw{suffix_pm}"
-            
-            val_am = self.coordinator.data.get(slug_am)
-            val_pm = self.coordinator.data.get(slug_pm)
-            
-            if val_am is not None and val_pm is not None:
-                try:
-                    day_events = self._decode_day(current_day, int(val_am), int(val_pm))
-                    events.extend(day_events)
-                except (ValueError, TypeError):
-                    pass
-
-            current_day += datetime.timedelta(days=1)
-            
         return events
 
-    def _decode_day(self, date_base: datetime.datetime, val_am: int, val_pm: int) -> List[CalendarEvent]:
-        """Decodes 48-bit binary schedule data for a single day.
-
-        Args:
-            date_base: The base date (00:00).
-            val_am: Integer value of the AM register (00:00-12:00).
-            val_pm: Integer value of the PM register (12:00-00:00).
-
-        Returns:
-            List[CalendarEvent]: List of events derived from the bitmask.
-        """
-        events = []
-        slots = []
-        for i in range(24): slots.append((val_am >> i) & 1 == 1)
-        for i in range(24): slots.append((val_pm >> i) & 1 == 1)
-        
-        if not slots: return []
-
-        current_start_slot = 0
-        current_state = slots[0]
-
-        for i in range(1, 48):
-            state = slots[i]
-            if state != current_state:
-                events.append(self._create_event(date_base, current_start_slot, i, current_state))
-                current_state = state
-                current_start_slot = i
-        
-        events.append(self._create_event(date_base, current_start_slot, 48, current_state))
-        return events
-
-    def _create_event(self, date_base, start_slot, end_slot, is_active) -> CalendarEvent:
+    def _create_event(self, day_start, start_slot, end_slot, is_active) -> CalendarEvent:
         """Creates a Home Assistant CalendarEvent object.
 
         Args:
-            date_base: The reference date.
+            day_start: Local midnight of the event's day.
             start_slot: Start index (0-47, representing 30min slots).
             end_slot: End index (0-48).
             is_active: Boolean indicating if the slot is Active (Comfort) or Eco.
@@ -170,17 +231,9 @@ class PlumEconetCalendar(CoordinatorEntity, CalendarEntity):
         Returns:
             CalendarEvent: The constructed event object.
         """
-        start_h = start_slot // 2
-        start_m = (start_slot % 2) * 30
-        end_h = end_slot // 2
-        end_m = (end_slot % 2) * 30
-        
-        dt_start = dt_util.as_local(date_base.replace(hour=int(start_h), minute=int(start_m), second=0, microsecond=0))
-        
-        if end_h >= 24:
-            dt_end = dt_util.as_local(date_base.replace(hour=0, minute=0, second=0, microsecond=0) + datetime.timedelta(days=1))
-        else:
-            dt_end = dt_util.as_local(date_base.replace(hour=int(end_h), minute=int(end_m), second=0, microsecond=0))
+        # Aware datetime arithmetic is wall-clock, so slot 48 is the next midnight
+        dt_start = day_start + start_slot * _SLOT
+        dt_end = day_start + end_slot * _SLOT
 
         if is_active:
             summary = "Active"
@@ -195,26 +248,3 @@ class PlumEconetCalendar(CoordinatorEntity, CalendarEntity):
             end=dt_end,
             description=description
         )
-    
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Links the calendar to the correct device registry entry.
-
-        Returns:
-            DeviceInfo: Configuration to link this entity to a circuit or HDW device.
-        """
-        if self._system_type == "circuit":
-            return DeviceInfo(
-                identifiers={(DOMAIN, f"{self._entry_id}_circuit_{self._index}")},
-                name=f"Circuit {self._index}",
-                manufacturer="Plum",
-                via_device=(DOMAIN, self._entry_id),
-            )
-        else:
-            return DeviceInfo(
-                identifiers={(DOMAIN, "plum_hdw")},
-                name="HDW",
-                manufacturer="Plum",
-                model="HDW Monitor",
-                via_device=(DOMAIN, self._entry_id),
-            )
\ No newline at end of file
@@ -5,6 +5,7 @@ control over target temperatures and HVAC modes (Heat/Off). It supports
 automatic fallback for temperature sensors if the thermostat sensor is missing.
 """
 import logging
+import sys
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
@@ -12,11 +13,11 @@ from homeassistant.components.climate import (
 )
 from homeassistant.const import UnitOfTemperature, ATTR_TEMPERATURE
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_ACTIVE_CIRCUITS
+from .const import DOMAIN, CONF_ACTIVE_CIRCUITS, CLIMATE_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,7 +27,8 @@ async def async_setup_entry(hass, entry, async_add_entities):
     This function dynamically creates climate entities for each active circuit
     defined in the configuration. It implements a fallback mechanism for the
     current temperature sensor: if the thermostat sensor is unavailable,
-    it uses the circuit temperature sensor instead.
+    it uses the circuit temperature sensor instead. The setpoint bounds follow
+    the device parameters and default to 10-30°C when unavailable.
 
     Args:
         hass: The Home Assistant instance.
@@ -43,12 +45,18 @@ async def async_setup_entry(hass, entry, async_add_entities):
         active_slug = f"circuit{circuit_id}active"
         
         # Fallback sensor
-        if current_slug not in coordinator.device.params_map:
+        if current_slug not in coordinator.device.params_keys:
              current_slug = f"tempcircuit{circuit_id}"
 
-        if target_slug in coordinator.device.params_map:
+        min_slug = max_slug = None
+        spec = CLIMATE_TYPES.get(str(circuit_id))
+        if spec is not None:
+            min_slug, max_slug = spec.min_temp, spec.max_temp
+
+        if target_slug in coordinator.device.params_keys:
              entities.append(PlumEcomaxClimate(
-                 coordinator, entry, circuit_id, current_slug, target_slug, active_slug
+                 coordinator, entry, circuit_id, current_slug, target_slug, active_slug,
+                 min_slug=min_slug, max_slug=max_slug,
             ))
 
     if entities:
@@ -65,10 +73,19 @@ class PlumEcomaxClimate(CoordinatorEntity, ClimateEntity):
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
     _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
+    _attr_min_temp = 10.0
+    _attr_max_temp = 30.0
+    _attr_target_temperature_step = 0.5
     
     _attr_translation_key = "thermostat"
 
-    def __init__(self, coordinator, entry, circuit_id, current_slug, target_slug, active_slug):
+    # Value of the circuit "active" parameter for each supported HVAC mode
+    _HVAC_TO_ACTIVE = {HVACMode.HEAT: 1, HVACMode.OFF: 0}
+
+    def __init__(
+        self, coordinator, entry, circuit_id, current_slug, target_slug, active_slug,
+        min_slug=None, max_slug=None,
+    ):
         """Initializes the climate entity.
 
         Args:
@@ -78,82 +95,57 @@ class PlumEcomaxClimate(CoordinatorEntity, ClimateEntity):
             current_slug: The slug for the current temperature sensor.
             target_slug: The slug for the target temperature parameter.
             active_slug: The slug for the active state parameter.
+            min_slug: The slug for the lowest setpoint accepted, if any.
+            max_slug: The slug for the highest setpoint accepted, if any.
         """
         super().__init__(coordinator)
-        self._circuit_id = circuit_id
-        self._entry_id = entry.entry_id
-        self._current_slug = current_slug
-        self._target_slug = target_slug
-        self._active_slug = active_slug
-
-    @property
-    def unique_id(self) -> str:
-        """Returns a unique ID for the climate entity.
-
-        Returns:
-            str: The unique identifier string.
-        """
-        return f"{DOMAIN}_{self._entry_id}_circuit_{self._circuit_id}_climate"
-
-    @property
-    def device_info(self) -> dict:
-        """Links the entity to the device registry.
-
-        Returns:
-            dict: Device info dictionary.
-        """
-        return {
-            "identifiers": {(DOMAIN, f"{self._entry_id}_circuit_{self._circuit_id}")},
-            "name": f"Circuit {self._circuit_id}",
+        self._current_slug = sys.intern(current_slug)
+        self._target_slug = sys.intern(target_slug)
+        self._active_slug = sys.intern(active_slug)
+        self._min_slug = min_slug
+        self._max_slug = max_slug
+
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_circuit_{circuit_id}_climate"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, f"{entry.entry_id}_circuit_{circuit_id}")},
+            "name": f"Circuit {circuit_id}",
             "manufacturer": "Plum",
             "model": "Heating controller",
-            "via_device": (DOMAIN, self._entry_id),
+            "via_device": (DOMAIN, entry.entry_id),
         }
 
-    @property
-    def min_temp(self): 
-        """Returns the minimum target temperature."""
-        return 10.0
-    @property
-    def max_temp(self): 
-        """Returns the maximum target temperature."""
-        return 30.0
-    @property
-    def target_temperature_step(self): 
-        """Returns the step size for target temperature."""
-        return 0.5
-
-    @property
-    def current_temperature(self):
-        """Returns the current temperature.
-
-        Returns:
-            float | None: The current temperature or None if unavailable.
-        """
-        val = self.coordinator.data.get(self._current_slug)
-        return float(val) if val is not None else None
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refreshes the cached state when the coordinator publishes new data."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
-    @property
-    def target_temperature(self):
-        """Returns the temperature we try to reach.
+    def _update_from_coordinator(self) -> None:
+        """Copies the circuit values from the coordinator data.
 
-        Returns:
-            float: The target temperature.
+        The current temperature is None if unavailable, the target falls back
+        to 20.0 and the mode is Off only when the circuit reports inactive.
+        The setpoint bounds keep their previous values (initially the class
+        defaults) unless the device reports a usable range.
         """
-        val = self.coordinator.data.get(self._target_slug)
-        if val is None: return 20.0 
-        return float(val)
+        data = self.coordinator.data
 
-    @property
-    def hvac_mode(self):
-        """Returns current operation mode (Heat or Off).
+        val = data.get(self._current_slug)
+        self._attr_current_temperature = float(val) if val is not None else None
 
-        Returns:
-            HVACMode: The current mode.
-        """
-        is_active = self.coordinator.data.get(self._active_slug)
-        if is_active == 0: return HVACMode.OFF
-        return HVACMode.HEAT
+        val = data.get(self._target_slug)
+        self._attr_target_temperature = float(val) if val is not None else 20.0
+
+        is_active = data.get(self._active_slug)
+        self._attr_hvac_mode = HVACMode.OFF if is_active == 0 else HVACMode.HEAT
+
+        min_temp = data.get(self._min_slug)
+        max_temp = data.get(self._max_slug)
+        if min_temp is not None and max_temp is not None and min_temp < max_temp:
+            self._attr_min_temp = float(min_temp)
+            self._attr_max_temp = float(max_temp)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Sets new target operation mode.
@@ -161,13 +153,17 @@ class PlumEcomaxClimate(CoordinatorEntity, ClimateEntity):
         Args:
             hvac_mode: The desired HVAC mode.
         """
-        value = 1 if hvac_mode == HVACMode.HEAT else 0
+        value = self._HVAC_TO_ACTIVE.get(hvac_mode)
+        if value is None:
+            _LOGGER.warning(f"Unsupported HVAC mode: {hvac_mode}")
+            return
         await self.coordinator.async_set_value(self._active_slug, value)
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Sets new target temperature.
 
-        If the device is currently Off, it will be switched to Heat mode automatically.
+        If the device is currently Off, it will be switched to Heat mode automatically,
+        in the same coordinator push as the new setpoint.
 
         Args:
             **kwargs: Keyword arguments containing ATTR_TEMPERATURE.
@@ -176,7 +172,8 @@ class PlumEcomaxClimate(CoordinatorEntity, ClimateEntity):
         if temp is None:
             return
 
+        values = {self._target_slug: temp}
         if self.hvac_mode == HVACMode.OFF:
-            await self.async_set_hvac_mode(HVACMode.HEAT)
+            values[self._active_slug] = self._HVAC_TO_ACTIVE[HVACMode.HEAT]
 
-        await self.coordinator.async_set_value(self._target_slug, temp)
\ No newline at end of file
+        await self.coordinator.async_set_values(values)
\ No newline at end of file
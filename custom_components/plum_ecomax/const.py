@@ -14,9 +14,12 @@ Attributes:
     DEFAULT_PORT (int): The default TCP port for the ecoNET module (8899).
     CONF_ACTIVE_CIRCUITS (str): Configuration key for active heating circuits.
     UPDATE_INTERVAL (int): Polling interval in seconds (30).
+    SLUG_TTL (dict): Cache lifetime per parameter pattern, in seconds.
     PLUM_TO_HA_HVAC (dict): Mapping from Plum WorkMode (0-3) to HA HVAC Modes.
-    SENSOR_TYPES (dict): Definitions of available sensors [Unit, Icon, DeviceClass].
+    SENSOR_TYPES (dict): Definitions of available sensors (SensorSpec).
 """
+from typing import Final, NamedTuple
+
 from homeassistant.const import (
     UnitOfTemperature,
     PERCENTAGE,
@@ -28,6 +31,29 @@ from homeassistant.const import (
     CONF_PORT,
 )
 
+# --- ENTITY DEFINITION RECORDS ---
+class SensorSpec(NamedTuple):
+    """Static definition of a sensor entity."""
+    unit: str | None
+    icon: str
+    device_class: str | None
+
+class ClimateSpec(NamedTuple):
+    """Parameter slugs backing a heating circuit thermostat."""
+    current: str
+    comfort: str
+    eco: str
+    workstate: str
+    min_temp: str
+    max_temp: str
+
+class NumberSpec(NamedTuple):
+    """Static definition of a number entity."""
+    min: float
+    max: float
+    step: float
+    icon: str
+
 # --- CONFIGURATION SWITCH (ON/OFF) ---
 # Format: "slug": "Friendly Name"
 SWITCH_TYPES = {
@@ -55,6 +81,13 @@ SELECT_TYPES = {
     "hdwusermode": ("DHW Mode", DHW_MODES_TO_HA, HA_TO_DHW_MODES),
 }
 
+# SELECT_TYPES flattened once at import, with the option list of each type
+# shared by its entities: (slug, name, map_to_ha, map_to_plum, options)
+SELECT_TYPES_ITEMS = tuple(
+    (slug, name, map_to_ha, map_to_plum, list(map_to_plum))
+    for slug, (name, map_to_ha, map_to_plum) in SELECT_TYPES.items()
+)
+
 # --- LOCAL CONSTANT DEFINITIONS (Independent of HA) ---
 # We define our own standard values to avoid any import issues
 HVAC_MODE_OFF = "off"
@@ -92,79 +125,99 @@ HA_TO_PLUM_PRESET = {
     PRESET_ECO: 2,
 }
 
-DOMAIN = "plum_ecomax"
-DEFAULT_PORT = 8899
+DOMAIN: Final = "plum_ecomax"
+DEFAULT_PORT: Final = 8899
 
 CONF_ACTIVE_CIRCUITS = "active_circuits"
 
 # Simplified Mapping (Just the keys)
 CIRCUIT_CHOICES = ["1", "2", "3", "4", "5", "6", "7"]
 
-UPDATE_INTERVAL = 30
+UPDATE_INTERVAL: Final = 30
+
+# --- POLLING ---
+# Cache lifetime in seconds per parameter, as fnmatch patterns (first match wins).
+# Parameters matching no pattern keep the coordinator's default TTL.
+SLUG_TTL = {
+    # Limits only change when reconfigured on the panel
+    "*minsettemp*": 3600,
+    "*maxsettemp*": 3600,
+    # Weekly schedules
+    "*day[ap]m": 900,
+    # Setpoints and modes, mostly written from Home Assistant itself
+    "*setpoint": 120,
+    "*comforttemp": 120,
+    "*ecotemp": 120,
+    "*workstate": 60,
+    "*usermode": 60,
+    # Fast-moving measurements, refreshed on every cycle
+    "temp*": 25,
+    "*thermostattemp": 25,
+    "mixer*valveposition": 25,
+    "boilerpower": 25,
+}
 
 # --- SENSOR CONFIGURATION ---
-# Format: "slug": [Unit, Icon, DeviceClass] (3 elements)
+# Format: "slug": SensorSpec(Unit, Icon, DeviceClass)
 SENSOR_TYPES = {
-    "tempwthr": [UnitOfTemperature.CELSIUS, "mdi:thermometer", "temperature"],
-    "boilerpower": [UnitOfPower.KILO_WATT, "mdi:flash", "power"],
-    "worktime": [UnitOfTime.SECONDS, "mdi:clock-outline", None],
-    "tempcwu": [UnitOfTemperature.CELSIUS, "mdi:water-boiler", "temperature"],
-    "tempbuforup": [UnitOfTemperature.CELSIUS, "mdi:water", "temperature"],
-    "tempbufordown": [UnitOfTemperature.CELSIUS, "mdi:water", "temperature"],
-    "tempclutch": [UnitOfTemperature.CELSIUS, "mdi:fire-alert", "temperature"],
-    "buforsetpoint": [UnitOfTemperature.CELSIUS, "mdi:target", "temperature"],
-
-    "tempcircuit1": [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "tempcircuit2": [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "tempcircuit3": [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "tempcircuit4": [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "tempcircuit5": [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "tempcircuit6": [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "tempcircuit7": [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
+    "tempwthr": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:thermometer", "temperature"),
+    "boilerpower": SensorSpec(UnitOfPower.KILO_WATT, "mdi:flash", "power"),
+    "worktime": SensorSpec(UnitOfTime.SECONDS, "mdi:clock-outline", None),
+    "tempcwu": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:water-boiler", "temperature"),
+    "tempbuforup": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:water", "temperature"),
+    "tempbufordown": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:water", "temperature"),
+    "tempclutch": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:fire-alert", "temperature"),
+    "buforsetpoint": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:target", "temperature"),
+
+    "tempcircuit1": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "tempcircuit2": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "tempcircuit3": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "tempcircuit4": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "tempcircuit5": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "tempcircuit6": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "tempcircuit7": SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
     
-    "circuit1thermostattemp" : [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "circuit2thermostattemp" : [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "circuit3thermostattemp" : [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "circuit4thermostattemp" : [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "circuit5thermostattemp" : [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "circuit6thermostattemp" : [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-    "circuit7thermostattemp" : [UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"],
-
-    "mixer1valveposition": [PERCENTAGE, "mdi:valve", None],
-    "mixer2valveposition": [PERCENTAGE, "mdi:valve", None],
-    "mixer3valveposition": [PERCENTAGE, "mdi:valve", None],
-    "mixer4valveposition": [PERCENTAGE, "mdi:valve", None],
-    "mixer5valveposition": [PERCENTAGE, "mdi:valve", None],
-    "mixer6valveposition": [PERCENTAGE, "mdi:valve", None],
-    "mixer7valveposition": [PERCENTAGE, "mdi:valve", None],
+    "circuit1thermostattemp" : SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "circuit2thermostattemp" : SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "circuit3thermostattemp" : SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "circuit4thermostattemp" : SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "circuit5thermostattemp" : SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "circuit6thermostattemp" : SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+    "circuit7thermostattemp" : SensorSpec(UnitOfTemperature.CELSIUS, "mdi:radiator", "temperature"),
+
+    "mixer1valveposition": SensorSpec(PERCENTAGE, "mdi:valve", None),
+    "mixer2valveposition": SensorSpec(PERCENTAGE, "mdi:valve", None),
+    "mixer3valveposition": SensorSpec(PERCENTAGE, "mdi:valve", None),
+    "mixer4valveposition": SensorSpec(PERCENTAGE, "mdi:valve", None),
+    "mixer5valveposition": SensorSpec(PERCENTAGE, "mdi:valve", None),
+    "mixer6valveposition": SensorSpec(PERCENTAGE, "mdi:valve", None),
+    "mixer7valveposition": SensorSpec(PERCENTAGE, "mdi:valve", None),
 }
 
 # --- THERMOSTATS ---
+# Format: "circuit_id": ClimateSpec(Current, Comfort, Eco, WorkState, MinTemp, MaxTemp)
 CLIMATE_TYPES = {
-    "1": ["tempcircuit1", "circuit1comforttemp","circuit1ecotemp", "circuit1workstate"],
-    "2": ["tempcircuit2", "circuit2comforttemp","circuit2ecotemp", "circuit2workstate"],
-    "3": ["tempcircuit3", "circuit3comforttemp","circuit3ecotemp", "circuit3workstate"],
-    "4": ["tempcircuit4", "circuit4comforttemp","circuit4ecotemp", "circuit4workstate"],
-    "5": ["tempcircuit5", "circuit5comforttemp","circuit5ecotemp", "circuit5workstate"],
-    "6": ["tempcircuit6", "circuit6comforttemp","circuit6ecotemp", "circuit6workstate"],
-    "7": ["tempcircuit7", "circuit7comforttemp","circuit7ecotemp", "circuit7workstate"],
+    "1": ClimateSpec("tempcircuit1", "circuit1comforttemp", "circuit1ecotemp", "circuit1workstate",
+                     "circuit1minsettemprad", "circuit1maxsettemprad"),
+    "2": ClimateSpec("tempcircuit2", "circuit2comforttemp", "circuit2ecotemp", "circuit2workstate",
+                     "circuit2minsettemprad", "circuit2maxsettemprad"),
+    "3": ClimateSpec("tempcircuit3", "circuit3comforttemp", "circuit3ecotemp", "circuit3workstate",
+                     "circuit3minsettemp", "circuit3maxsettemp"),
+    "4": ClimateSpec("tempcircuit4", "circuit4comforttemp", "circuit4ecotemp", "circuit4workstate",
+                     "circuit4minsettemprad", "circuit4maxsettemprad"),
+    "5": ClimateSpec("tempcircuit5", "circuit5comforttemp", "circuit5ecotemp", "circuit5workstate",
+                     "circuit5minsettemprad", "circuit5maxsettemprad"),
+    "6": ClimateSpec("tempcircuit6", "circuit6comforttemp", "circuit6ecotemp", "circuit6workstate",
+                     "circuit6minsettemprad", "circuit6maxsettemprad"),
+    "7": ClimateSpec("tempcircuit7", "circuit7comforttemp", "circuit7ecotemp", "circuit7workstate",
+                     "circuit7minsettemprad", "circuit7maxsettemprad"),
 }
 
+# Format: "slug": NumberSpec(Min, Max, Step, Icon)
 NUMBER_TYPES = {
     
 }
 
-
-WEEKDAY_TO_SLUGS = {
-    0: ("mondayam", "mondaypm"),
-    1: ("tuesdayam", "tuesdaypm"),
-    2: ("wednesdayam", "wednesdaypm"),
-    3: ("thursdayam", "thursdaypm"),
-    4: ("fridayam", "fridaypm"),
-    5: ("saturdayam", "saturdaypm"),
-    6: ("sundayam", "sundaypm")
-}
-
 # --- WATER HEATER CONFIGURATION ---
 # Format: "Name": (Current_Temp, Setpoint, Min, Max, Mode_Slug, Force_Slug)
 WATER_HEATER_TYPES = {
@@ -187,11 +240,7 @@ PLUM_TO_HA_WATER_HEATER = {
     2: "eco"          # Considered as "Auto / Schedule"
 }
 
-HA_TO_PLUM_WATER_HEATER = {
-    "off": 0,
-    "performance": 1,
-    "eco": 2
-}
+HA_TO_PLUM_WATER_HEATER = {state: code for code, state in PLUM_TO_HA_WATER_HEATER.items()}
 
 # Mapping for calendar
 WEEKDAY_TO_SLUGS = {
@@ -216,4 +265,13 @@ for day_id, (suffix_am, suffix_pm) in WEEKDAY_TO_SLUGS.items():
     slug_am = f"hdw{suffix_am}"
     slug_pm = f"hdw{suffix_pm}"
     SCHEDULE_TYPES[slug_am] = "DHW AM"
-    SCHEDULE_TYPES[slug_pm] = "DHW PM"
\ No newline at end of file
+    SCHEDULE_TYPES[slug_pm] = "DHW PM"
+
+# Every parameter the platforms may use, in detection order (without duplicates)
+ALL_KNOWN_SLUGS = tuple(dict.fromkeys([
+    *SENSOR_TYPES,
+    *(slug for conf in CLIMATE_TYPES.values() for slug in conf),
+    *NUMBER_TYPES,
+    *(slug for conf in WATER_HEATER_TYPES.values() for slug in conf),
+    *SCHEDULE_TYPES,
+]))
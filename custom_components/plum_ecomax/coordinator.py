@@ -6,11 +6,15 @@ write strategy to ensure commands reach the device despite network latency.
 """
 import logging
 import asyncio
+import math
 import time
+from collections import OrderedDict
 from datetime import timedelta
+from fnmatch import fnmatchcase
 from typing import Any, Dict, Tuple, Optional
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 # Conditional import for typing only
@@ -21,17 +25,28 @@ if TYPE_CHECKING:
 from .const import (
     DOMAIN,
     UPDATE_INTERVAL,
-    SENSOR_TYPES,
-    CLIMATE_TYPES,
-    NUMBER_TYPES,
-    SCHEDULE_TYPES,
-    WATER_HEATER_TYPES,
+    SLUG_TTL,
+    ALL_KNOWN_SLUGS,
 )
+from .plum_device import backoff_delay
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TTL = 300
 
+# Upper bound on cached parameters, well above the number of known slugs
+CACHE_MAX_SIZE = 512
+
+# Maximum number of single-parameter reads in flight at once
+MAX_PARALLEL_READS = 4
+
+# Background write delivery: attempts and backoff (base, cap) in seconds
+WRITE_ATTEMPTS = 5
+WRITE_RETRY_BACKOFF = (1.0, 16.0)
+
+# Delay (seconds) collapsing bursts of refresh requests into a single poll
+REQUEST_REFRESH_COOLDOWN = 2.0
+
 # Definitions of physical limits for validation
 VALIDATION_RANGES = {
     "temp": (-20, 100.0),
@@ -42,6 +57,80 @@ VALIDATION_RANGES = {
     "lambda": (0.0, 25.0),
 }
 
+class SlugCache:
+    """Bounded LRU store of parameter values and the time they were read.
+
+    Keeping the value and its timestamp in a single entry means both are
+    evicted together once `maxsize` parameters are cached.
+    """
+
+    def __init__(self, maxsize: int = CACHE_MAX_SIZE):
+        """Initializes an empty cache.
+
+        Args:
+            maxsize: Number of parameters kept before the least recently
+                used one is evicted.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, slug: str, default: Any = None) -> Any:
+        """Returns the cached value of a parameter, whatever its age."""
+        entry = self._entries.get(slug)
+        return default if entry is None else entry[0]
+
+    def lookup(self, slug: str, ttl: float, now: float) -> Any:
+        """Returns the cached value if it is younger than `ttl`, else None.
+
+        Args:
+            slug: The parameter identifier.
+            ttl: Maximum age in seconds.
+            now: Current monotonic time.
+
+        Returns:
+            Any: The fresh value, or None on a miss.
+        """
+        entry = self._entries.get(slug)
+        if entry is None or entry[0] is None or now - entry[1] >= ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(slug)
+        return entry[0]
+
+    def stamp(self, slug: str) -> Optional[float]:
+        """Returns the time a parameter was last stored, or None if absent."""
+        entry = self._entries.get(slug)
+        return None if entry is None else entry[1]
+
+    def set(self, slug: str, value: Any, stamp: float) -> None:
+        """Stores a value read (or written) at `stamp`."""
+        self._entries[slug] = (value, stamp)
+        self._entries.move_to_end(slug)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def update(self, values: Dict[str, Any], stamp: float) -> None:
+        """Stores several values sharing the same timestamp."""
+        for slug, value in values.items():
+            self.set(slug, value, stamp)
+
+    def invalidate(self, slug: Optional[str] = None) -> None:
+        """Drops one parameter, or the whole cache when `slug` is None."""
+        if slug is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(slug, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
 class PlumDataUpdateCoordinator(DataUpdateCoordinator):
     """Centralized data management with Robust Data Validation.
 
@@ -57,19 +146,24 @@ class PlumDataUpdateCoordinator(DataUpdateCoordinator):
             device: The low-level PlumDevice instance.
         """
         self.device = device
-        self.available_slugs: list[str] = []
+        self.available_slugs: Tuple[str, ...] = ()
+        # (slug, ttl) pairs polled on each refresh, fixed after detection
+        self._poll_plan: Tuple[Tuple[str, float], ...] = ()
         
         # Cache System
-        self._cache: Dict[str, Any] = {}
-        self._timestamps: Dict[str, float] = {}
-        self._cache_lock = asyncio.Lock()
+        self._cache = SlugCache()
         self.ttl = DEFAULT_TTL
+        self._ttls: Dict[str, float] = {}
+        self._validators: Dict[str, Tuple[Any, Any, Any, Any, Any]] = {}
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
 
     async def _async_update_data(self) -> Dict[str, Any]:
@@ -79,47 +173,160 @@ class PlumDataUpdateCoordinator(DataUpdateCoordinator):
             dict: The validated data.
         """
         data = {}
-        now = time.time()
+        now = time.monotonic()
         
         if not self.available_slugs:
             await self._detect_available_parameters()
 
-        for slug in self.available_slugs:
-            async with self._cache_lock:
-                last_update = self._timestamps.get(slug, 0)
-                is_fresh = (now - last_update) < self.ttl
-                cached_val = self._cache.get(slug)
+        # Snapshot reads: refreshes never overlap, so the cache is read
+        # directly. Fresh values go straight to the result, only the
+        # stale ones make it to the fetch worklist.
+        lookup = self._cache.lookup
+        stale_slugs = []
+        for slug, ttl in self._poll_plan:
+            cached_val = lookup(slug, ttl, now)
 
             # 1. Cache Hit
-            if is_fresh and cached_val is not None:
+            if cached_val is not None:
+                data[slug] = cached_val
+            else:
+                stale_slugs.append(slug)
+
+        if not stale_slugs:
+            return data
+
+        # 2. Batch fetch of every stale parameter over a single connection
+        try:
+            fetched = await self.device.get_values(stale_slugs)
+        except Exception as e:
+            _LOGGER.warning(f"Batch read failed: {e}")
+            fetched = {}
+
+        # 3. Single reads for whatever the batch missed
+        missing = [slug for slug in stale_slugs if slug not in fetched]
+        if missing:
+            fetched.update(await self._fetch_each(missing, retries=2))
+
+        # 4. Validate
+        updates = {}
+        for slug in stale_slugs:
+            cached_val = self._cache.get(slug)
+            stamp = self._cache.stamp(slug)
+            if stamp is not None and stamp > now:
+                # Written while this refresh was reading: the read is older
+                # than the cached value, which must not be overwritten
                 data[slug] = cached_val
                 continue
-
-            # 2. Fetch & Validate
-            try:
-                raw_val = await self.device.get_value(slug, retries=2)
-                
+            if slug in fetched:
                 # --- VALIDATION STEP ---
-                is_valid, final_val = self._validate_value(slug, raw_val, cached_val)
-
+                is_valid, final_val = self._validate_value(slug, fetched[slug], cached_val)
                 if is_valid:
                     # Valid new data: Update cache
-                    async with self._cache_lock:
-                        self._cache[slug] = final_val
-                        self._timestamps[slug] = time.time()
+                    updates[slug] = final_val
                     data[slug] = final_val
-                else:
-                    # Invalid data: Use fallback (Hold Last State)
-                    if cached_val is not None:
-                        data[slug] = cached_val
-                    
-            except Exception as e:
-                _LOGGER.warning(f"Error reading {slug}: {e}")
-                if slug in self._cache:
-                    data[slug] = self._cache[slug]
+                    continue
+
+            # Invalid or missing data: Use fallback (Hold Last State)
+            if cached_val is not None:
+                data[slug] = cached_val
+
+        # No await between here and the return, so the batch lands atomically
+        # with respect to the event loop without taking the lock
+        if updates:
+            self._cache.update(updates, time.monotonic())
         
         return data
 
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Returns cache diagnostics (hits, misses and size)."""
+        return self._cache.stats()
+
+    def invalidate_cache(self, slug: Optional[str] = None) -> None:
+        """Forgets one cached parameter, or all of them.
+
+        Args:
+            slug: The parameter to drop; None clears the whole cache.
+        """
+        self._cache.invalidate(slug)
+
+    def _ttl_for(self, slug: str) -> float:
+        """Returns the cache lifetime of a parameter.
+
+        The first matching pattern of `SLUG_TTL` wins; the result is memoized
+        since the slug set is fixed after detection.
+
+        Args:
+            slug: The parameter identifier.
+
+        Returns:
+            float: The lifetime in seconds.
+        """
+        ttl = self._ttls.get(slug)
+        if ttl is None:
+            ttl = next(
+                (value for pattern, value in SLUG_TTL.items() if fnmatchcase(slug, pattern)),
+                self.ttl,
+            )
+            self._ttls[slug] = ttl
+        return ttl
+
+    async def _fetch_each(self, slugs: list[str], retries: int) -> Dict[str, Any]:
+        """Reads parameters one by one, with the requests running concurrently.
+
+        The device serializes access to its socket, but overlapping the calls
+        lets their retry delays elapse in parallel instead of back to back.
+
+        Args:
+            slugs: The parameters to read.
+            retries: Number of attempts per parameter.
+
+        Returns:
+            Dict[str, Any]: The raw values, keyed by slug. Parameters whose read
+            raised an exception are left out.
+        """
+        sem = asyncio.Semaphore(MAX_PARALLEL_READS)
+
+        async def fetch(slug: str) -> Optional[Tuple[str, Any]]:
+            async with sem:
+                try:
+                    return slug, await self.device.get_value(slug, retries=retries)
+                except Exception as e:
+                    _LOGGER.warning(f"Error reading {slug}: {e}")
+                    return None
+
+        results = await asyncio.gather(*(fetch(slug) for slug in slugs))
+        return dict(result for result in results if result is not None)
+
+    def _validator_for(self, slug: str) -> Tuple[Any, Any, Any, Any, Any]:
+        """Returns the resolved validation constants of a parameter.
+
+        The JSON limits and the first matching `VALIDATION_RANGES` entry are
+        looked up once per slug and memoized, since the map never changes.
+        Detection warms the table for every available parameter.
+
+        Args:
+            slug: The parameter identifier.
+
+        Returns:
+            Tuple: (json_min, json_max, json_max_delta, generic_min, generic_max).
+        """
+        validator = self._validators.get(slug)
+        if validator is None:
+            param_def = self.device.params_map.get(slug, {})
+            generic_min, generic_max = next(
+                (bounds for keyword, bounds in VALIDATION_RANGES.items() if keyword in slug),
+                (None, None),
+            )
+            validator = (
+                param_def.get("min"),
+                param_def.get("max"),
+                param_def.get("max_delta"),
+                generic_min,
+                generic_max,
+            )
+            self._validators[slug] = validator
+        return validator
+
     def _validate_value(self, slug: str, raw_val: Any, cached_val: Any) -> Tuple[bool, Any]:
         """Sanitizes the raw value based on JSON limits or Generic constraints.
 
@@ -134,44 +341,33 @@ class PlumDataUpdateCoordinator(DataUpdateCoordinator):
         # A. Basic protocol checks
         if raw_val is None:
             return False, None
-            
-        if isinstance(raw_val, (int, float)):
-            if raw_val == 999.0 or raw_val == 999:
-                _LOGGER.debug(f"⚠️ Rejection: {slug} returned sensor error code {raw_val}")
-                return False, None
-                
-        param_def = self.device.params_map.get(slug, {})
-        json_min = param_def.get("min")
-        json_max = param_def.get("max")
-        json_max_delta = param_def.get("max_delta")
+        # Decoded values are plain ints/floats, so an exact type check is enough
+        if raw_val.__class__ not in (int, float):
+            return True, raw_val
+        if raw_val == 999:
+            _LOGGER.debug(f"⚠️ Rejection: {slug} returned sensor error code {raw_val}")
+            return False, None
+        if raw_val.__class__ is float and not math.isfinite(raw_val):
+            # NaN/Inf never reach the entities (NaN would pass the bounds checks)
+            _LOGGER.debug(f"⚠️ Rejection: {slug} returned non-finite value {raw_val}")
+            return False, None
+
+        json_min, json_max, json_max_delta, generic_min, generic_max = self._validator_for(slug)
 
         # B. Specific bounds check (JSON)
-        if (json_min is not None or json_max is not None) and isinstance(raw_val, (int, float)):
-            is_valid = True
-            
+        if json_min is not None or json_max is not None:
             if json_min is not None and raw_val < json_min:
-                is_valid = False
+                return False, None
             if json_max is not None and raw_val > json_max:
-                is_valid = False
-            # Fix typo from original code: is_valide -> is_valid
+                return False, None
             if json_max_delta is not None and cached_val is not None and abs(cached_val - raw_val) > json_max_delta:
-                is_valid = False
-                
-            if not is_valid:
                 return False, None
-        
             return True, raw_val
 
         # C. Generic bounds check (Fallback)
-        if isinstance(raw_val, (int, float)):
-            for keyword, (min_v, max_v) in VALIDATION_RANGES.items():
-                if keyword in slug:
-                    if not (min_v <= raw_val <= max_v):
-                        return False, None
-                    break 
-                    
+        if generic_min is not None and not (generic_min <= raw_val <= generic_max):
+            return False, None
         return True, raw_val
-        
 
     async def async_set_value(self, slug: str, value: Any) -> bool:
         """Writes a value using Optimistic UI + Repeated Background Sends.
@@ -184,63 +380,91 @@ class PlumDataUpdateCoordinator(DataUpdateCoordinator):
             slug: The parameter identifier.
             value: The value to write.
 
+        Returns:
+            bool: Always True (Optimistic).
+        """
+        return await self.async_set_values({slug: value})
+
+    async def async_set_values(self, values: Dict[str, Any]) -> bool:
+        """Writes several values with a single optimistic state push.
+
+        Same strategy as `async_set_value`, but listeners are notified once
+        for the whole batch instead of once per parameter.
+
+        Args:
+            values: The values to write, keyed by parameter identifier.
+
         Returns:
             bool: Always True (Optimistic).
         """
         # 1. Optimistic Cache Update (Immediate)
-        async with self._cache_lock:
-            self._cache[slug] = value
-            self._timestamps[slug] = time.time()
+        self._cache.update(values, time.monotonic())
         
-        # Notify Home Assistant immediately
-        self.async_set_updated_data(self._cache)
-        _LOGGER.info(f"✅ Optimistic set for {slug}={value}. Launching background sends.")
+        # Notify Home Assistant immediately with a fresh snapshot: handing out
+        # the cache itself would let later cache writes leak into `data` and
+        # would push slugs that were filtered out at detection
+        self.async_set_updated_data({**(self.data or {}), **values})
 
-        # 2. Launch background task for repeated sending
+        # 2. Launch background tasks for repeated sending
         # This prevents blocking the UI or the event loop
-        asyncio.create_task(self._perform_repeated_write(slug, value))
+        for slug, value in values.items():
+            _LOGGER.info(f"✅ Optimistic set for {slug}={value}. Launching background sends.")
+            # Tied to the config entry, so unloading it cancels pending sends
+            self.config_entry.async_create_background_task(
+                self.hass, self._perform_repeated_write(slug, value), name=f"plum_write_{slug}"
+            )
         
         return True
 
     async def _perform_repeated_write(self, slug: str, value: Any) -> None:
-        """Background task to spam the write command.
+        """Background task delivering a write until the device acknowledges it.
 
-        Sends the command 5 times with a 2-second interval.
+        Sends the command up to `WRITE_ATTEMPTS` times, stopping at the first
+        acknowledgement, with an exponential backoff (plus jitter) between
+        sends. If none is acknowledged, the optimistic value is dropped and a
+        refresh is scheduled in the background to restore the real device state.
 
         Args:
             slug: Parameter slug.
             value: Value to write.
         """
-        for i in range(1, 6): # 5 attempts
-            _LOGGER.debug(f"📤 Sending {slug}={value} (Attempt {i}/5)")
-            await self.device.set_value(slug, value)
-            
-            # Wait 2 seconds between sends, but not after the last one
-            if i < 5:
-                await asyncio.sleep(2.0)
+        for attempt in range(1, WRITE_ATTEMPTS + 1):
+            _LOGGER.debug(f"📤 Sending {slug}={value} (Attempt {attempt}/{WRITE_ATTEMPTS})")
+            if await self.device.set_value(slug, value):
+                return
+
+            if attempt < WRITE_ATTEMPTS:
+                await asyncio.sleep(backoff_delay(attempt, *WRITE_RETRY_BACKOFF))
+
+        _LOGGER.warning(f"❌ Write {slug}={value} was never acknowledged, refreshing.")
+        self.invalidate_cache(slug)
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_request_refresh(), name=f"plum_refresh_{slug}"
+        )
 
     async def _detect_available_parameters(self) -> None:
         """Initial scan to filter out unsupported parameters."""
         _LOGGER.info("🔍 Initial scan of available parameters...")
         
-        targets = []
-        targets.extend(list(SENSOR_TYPES.keys()))
-        for conf in CLIMATE_TYPES.values(): targets.extend(conf) 
-        targets.extend(list(NUMBER_TYPES.keys()))
-        for conf in WATER_HEATER_TYPES.values(): targets.extend(conf)
-        # Added Schedule types to detection
-        targets.extend(list(SCHEDULE_TYPES.keys()))
-        
-        valid_slugs = []
-        for slug in targets:
-            if slug not in self.device.params_map:
-                continue
-                
-            val = await self.device.get_value(slug, retries=5)
-            
-            # Filter invalid values (999.0 often indicates a disconnected probe)
-            if val is not None and val != 999.0:
-                 valid_slugs.append(slug)
-        
-        self.available_slugs = list(set(valid_slugs))
-        _LOGGER.info(f"✅ {len(self.available_slugs)} active parameters retained.")
\ No newline at end of file
+        # ALL_KNOWN_SLUGS is built once at import; keep its order for detection
+        known = self.device.params_keys
+        targets = [slug for slug in ALL_KNOWN_SLUGS if slug in known]
+
+        # One batched pass, then concurrent retries for what it missed
+        values = await self.device.get_values(targets)
+        missing = [slug for slug in targets if slug not in values]
+        if missing:
+            values.update(await self._fetch_each(missing, retries=5))
+
+        # Filter invalid values (999.0 often indicates a disconnected probe)
+        self.available_slugs = tuple(
+            slug for slug in targets
+            if values.get(slug) is not None and values[slug] != 999.0
+        )
+        _LOGGER.info(f"✅ {len(self.available_slugs)} active parameters retained.")
+
+        # Resolve the lifetimes and validation constants now rather than on
+        # every poll
+        self._poll_plan = tuple((slug, self._ttl_for(slug)) for slug in self.available_slugs)
+        for slug in self.available_slugs:
+            self._validator_for(slug)
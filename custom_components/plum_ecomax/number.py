@@ -6,6 +6,7 @@ or other adjustable settings defined in `NUMBER_TYPES`.
 """
 import logging
 from homeassistant.components.number import NumberEntity
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN, NUMBER_TYPES
 
@@ -23,10 +24,12 @@ async def async_setup_entry(hass, entry, async_add_entities):
         async_add_entities: Callback to add entities to Home Assistant.
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
-    for slug, config in NUMBER_TYPES.items():
-        if slug in coordinator.device.params_map:
-            entities.append(PlumEcomaxNumber(coordinator, entry, slug, config))
+    keys = coordinator.device.params_keys
+    entities = [
+        PlumEcomaxNumber(coordinator, entry, slug, config)
+        for slug, config in NUMBER_TYPES.items()
+        if slug in keys
+    ]
     if entities:
         async_add_entities(entities)
 
@@ -46,58 +49,35 @@ class PlumEcomaxNumber(CoordinatorEntity, NumberEntity):
             coordinator: The data update coordinator.
             entry: The config entry.
             slug: The parameter identifier string.
-            config: A tuple containing (min, max, step, icon).
+            config: The NumberSpec (min, max, step, icon) from const.py.
         """
         super().__init__(coordinator)
         self._slug = slug
-        
-        # --- INDEX CHANGE ---
-        self._min_val = config[0]
-        self._max_val = config[1]
-        self._step_val = config[2]
-        self._icon_val = config[3]
-        
         self._entry_id = entry.entry_id
+
         self._attr_translation_key = slug
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_number_{slug}"
+        self._attr_native_min_value = config.min
+        self._attr_native_max_value = config.max
+        self._attr_native_step = config.step
+        self._attr_icon = config.icon
 
-    @property
-    def unique_id(self) -> str:
-        """Returns the unique ID of the entity.
+        self._update_native_value()
 
-        Returns:
-            str: The unique identifier.
-        """
-        return f"{DOMAIN}_{self._entry_id}_number_{self._slug}"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refreshes the cached value when the coordinator publishes new data."""
+        self._update_native_value()
+        super()._handle_coordinator_update()
 
-    @property
-    def native_value(self):
-        """Returns the current value of the number.
+    def _update_native_value(self) -> None:
+        """Stores the current value as a float, or None if unavailable.
 
-        Returns:
-            float | None: The current value or None if unavailable.
+        The conversion runs once per coordinator update instead of on every
+        state read.
         """
         val = self.coordinator.data.get(self._slug)
-        return float(val) if val is not None else None
-
-    @property
-    def native_min_value(self) -> float:
-        """Returns the minimum allowed value."""
-        return self._min_val
-
-    @property
-    def native_max_value(self) -> float:
-        """Returns the maximum allowed value."""
-        return self._max_val
-
-    @property
-    def native_step(self) -> float:
-        """Returns the step increment."""
-        return self._step_val
-
-    @property
-    def icon(self) -> str:
-        """Returns the icon for the entity."""
-        return self._icon_val
+        self._attr_native_value = float(val) if val is not None else None
 
     async def async_set_native_value(self, value: float) -> None:
         """Sets a new value for the entity.
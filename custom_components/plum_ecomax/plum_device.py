@@ -1,22 +1,29 @@
 """Low-level communication layer for Plum EcoMAX devices.
 
-This module handles the TCP socket connections, frame construction (RS-485 over TCP),
-CRC calculation, and data encoding/decoding. It acts as the driver that talks
-directly to the ecoMax module.
+This module handles the request/response exchanges (RS-485 over TCP) on a
+persistent asyncio connection provided by `AsyncPlumTransport`, and data
+encoding/decoding. It acts as the driver that talks directly to the ecoMax module.
 
 Attributes:
     DEST_ID (int): The default destination address for the boiler (1).
     SOURCE_ID (int): The source address for the integration (100).
     CMD_READ_VAL (int): Command ID to read a parameter (0x43).
     CMD_WRITE_FORCE (int): Command ID to write a parameter (0x29).
+    REPLY_FLAG (int): Bit set in the command ID of a reply (0x80).
 """
 import asyncio
-import json
+import math
 import struct
 import logging
-import socket
-import time
-from typing import Any, Dict, Optional
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+import orjson
+
+from .plum_protocol import BoilerFrame, POW10, POW10_BIAS
+from .plum_transport import AsyncPlumTransport
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +32,65 @@ DEST_ID = 1
 SOURCE_ID = 100
 CMD_READ_VAL = 0x43
 CMD_WRITE_FORCE = 0x29
+# Set in the function code of the device's reply to a request
+REPLY_FLAG = 0x80
+
+# Seconds allowed to open the connection or to receive a response
+IO_TIMEOUT = 2.0
+
+# Retry backoff (seconds): base * 2**attempt, capped, plus up to 50% jitter
+READ_BACKOFF = (0.2, 5.0)
+WRITE_BACKOFF = (0.5, 10.0)
+BACKOFF_JITTER = 0.5
+
+# Fixed payload layouts: read request (session, count, count, id) and parameter id
+_READ_STRUCT = struct.Struct("<HBBH")
+_PID_STRUCT = struct.Struct("<H")
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Returns the delay before retry number `attempt` (starting at 1)."""
+    return min(cap, base * (2 ** attempt)) * (1 + random.random() * BACKOFF_JITTER)
+
+class Codec(NamedTuple):
+    """Precompiled binary layout of a parameter value.
+
+    Attributes:
+        struct: The packer/unpacker for the raw value.
+        scale: The exponent multiplier (10 ** exponent, from the POW10 table).
+        is_float: True for FLOAT parameters (no integer scaling on write).
+    """
+    struct: struct.Struct
+    scale: float
+    is_float: bool
+
+# Raw layout per parameter type of the device map
+_TYPE_STRUCTS = {
+    "FLOAT": struct.Struct("<f"),
+    "BYTE": struct.Struct("B"),
+    "SHORT_INT": struct.Struct("B"),
+    "BOOL": struct.Struct("B"),
+    "INT": struct.Struct("<h"),
+    "WORD": struct.Struct("<h"),
+    "DWORD": struct.Struct("<i"),
+    "LONG_INT": struct.Struct("<i"),
+}
+
+def _build_codecs(params_map: Dict[str, Any]) -> Dict[str, Codec]:
+    """Compiles the codec of every parameter with a supported type and exponent."""
+    codecs = {}
+    for slug, param in params_map.items():
+        packer = _TYPE_STRUCTS.get(param['type'])
+        if packer is None:
+            continue
+        exp = param['exponent']
+        if not -POW10_BIAS <= exp <= POW10_BIAS:
+            logger.warning(f"Unsupported exponent {exp} for {slug}, parameter ignored")
+            continue
+        codecs[slug] = Codec(packer, POW10[exp + POW10_BIAS], param['type'] == "FLOAT")
+    return codecs
+
+# Parsed parameter maps and their codecs, shared by every device reading the same file
+_MAP_CACHE: Dict[str, Tuple[Dict[str, Any], Dict[str, Codec]]] = {}
 
 class PlumDevice:
     """Handles low-level communication with the Plum EcoMAX boiler.
@@ -49,82 +115,94 @@ class PlumDevice:
         self.user = user
         self.map_file = map_file
         self.params_map: Dict[str, Any] = {}
+        self.params_keys: frozenset = frozenset()
+        self._codecs: Dict[str, Codec] = {}
         self.session_id = 10
         self._data_cache = {} 
 
+        # Long-lived connection; one request/response exchange at a time
+        self._transport = AsyncPlumTransport(ip, port)
+        self._io_lock = asyncio.Lock()
+
     def load_map(self):
         """Loads the parameter definition map from the JSON file.
 
-        The map file defines the ID, type, and exponent for each parameter slug.
+        The map file defines the ID, type, and exponent for each parameter slug,
+        from which the per-parameter codecs are compiled; `params_keys` holds
+        the known slugs for membership tests. Parsed maps are cached per file,
+        so several devices sharing a map only read it once. This is blocking
+        I/O: use `async_load_map` from the loop.
         """
         try:
-            with open(self.map_file, 'r') as f:
-                self.params_map = json.load(f)
+            cached = _MAP_CACHE.get(self.map_file)
+            if cached is None:
+                # Interned slugs let the dict lookups downstream match by identity
+                params_map = {
+                    sys.intern(slug): param
+                    for slug, param in orjson.loads(Path(self.map_file).read_bytes()).items()
+                }
+                cached = _MAP_CACHE[self.map_file] = (params_map, _build_codecs(params_map))
+            self.params_map, self._codecs = cached
+            self.params_keys = frozenset(self.params_map)
         except Exception as e:
             logger.error(f"Error loading map: {e}")
 
+    async def async_load_map(self):
+        """Loads the parameter definition map without blocking the event loop."""
+        await asyncio.to_thread(self.load_map)
+
     # --- ENCODING / DECODING ---
-    def _encode(self, value: Any, param_def: dict) -> bytes:
-        """Encodes a Python value into raw bytes based on the parameter definition.
+    def _encode(self, value: Any, codec: Codec) -> bytes:
+        """Encodes a Python value into raw bytes based on the parameter codec.
 
         Args:
             value: The value to encode.
-            param_def: Dictionary containing 'type' and 'exponent'.
+            codec: The precompiled codec of the parameter.
 
         Returns:
             bytes: The binary representation of the value, or None if encoding fails.
         """
-        ptype = param_def['type']
-        exp = param_def['exponent']
-        
+        if not isinstance(value, (int, float)) or not math.isfinite(value):
+            return None
+
         # Exponent handling (e.g., 20.5 -> 205 if exponent=1)
-        if ptype != "FLOAT" and isinstance(value, (int, float)) and exp != 0:
-            value = int(round(value / (10 ** exp)))
+        if not codec.is_float and codec.scale != 1:
+            value = round(value / codec.scale)
 
         try:
-            if ptype == "FLOAT": return struct.pack("<f", float(value))
-            elif ptype in ["BYTE", "SHORT_INT", "BOOL"]: return struct.pack("B", int(value))
-            elif ptype in ["INT", "WORD"]: return struct.pack("<h", int(value))
-            elif ptype in ["DWORD", "LONG_INT"]: return struct.pack("<i", int(value))
+            return codec.struct.pack(float(value) if codec.is_float else int(value))
+        except struct.error:
+            # Out of range for the parameter type
             return None
-        except: return None
 
-    def _decode(self, data: bytes, param_def: dict) -> Any:
+    def _decode(self, data: bytes, codec: Codec, offset: int = 0) -> Any:
         """Decodes raw bytes into a Python value.
 
         Args:
             data: The raw binary data received from the device.
-            param_def: Dictionary containing 'type' and 'exponent'.
+            codec: The precompiled codec of the parameter.
+            offset: Position of the value in `data`, read in place.
 
         Returns:
-            Any: The decoded value (float, int, or bool).
+            Any: The decoded value (float, int, or bool), or None if the data
+            is too short for the parameter type.
         """
-        ptype = param_def['type']
-        exp = param_def['exponent']
-        try:
-            val = None
-            if ptype == "FLOAT" and len(data) >= 4:
-                val = struct.unpack("<f", data[:4])[0]
-                val = round(val, 2)
-            elif ptype in ["BYTE", "SHORT_INT", "BOOL"] and len(data) >= 1:
-                val = data[0]
-            elif ptype in ["INT", "WORD"] and len(data) >= 2:
-                val = struct.unpack("<h", data[:2])[0]
-            elif ptype in ["DWORD", "LONG_INT"] and len(data) >= 4:
-                val = struct.unpack("<i", data[:4])[0]
-
-            if val is not None and isinstance(val, (int, float)) and exp != 0:
-                val = val * (10 ** exp)
-                val = round(val, 2)
-            return val
-        except: return None
+        if len(data) - offset < codec.struct.size:
+            return None
+
+        val = codec.struct.unpack_from(data, offset)[0]
+        if codec.is_float:
+            val = round(val, 2)
+        if codec.scale != 1:
+            val = round(val * codec.scale, 2)
+        return val
 
     # --- API ---
     async def get_value(self, slug: str, retries: int = 3) -> Any:
         """Asynchronously fetches a parameter value.
 
-        Wrapper around the synchronous `_sync_get_value` method, executed in a thread.
-        It implements a retry mechanism and caching strategy.
+        Sends a read request on the shared connection. It implements a retry
+        mechanism and caching strategy.
 
         Args:
             slug: The string identifier of the parameter.
@@ -134,19 +212,55 @@ class PlumDevice:
             Any: The current value, or the last cached value if communication fails.
         """
         param = self.params_map.get(slug)
-        if not param: return None
+        codec = self._codecs.get(slug)
+        if not param or not codec: return None
         pid = param['id']
 
         for attempt in range(1, retries + 1):
-            val = await asyncio.to_thread(self._sync_get_value, pid, param)
+            async with self._io_lock:
+                resp = await self._transaction(CMD_READ_VAL, self._read_payload(pid))
+            val = self._parse_read_response(resp, codec)
             if val is not None:
                 self._data_cache[slug] = val  # Caching
                 return val
-            await asyncio.sleep(0.2 * attempt)
+            if attempt < retries:
+                await asyncio.sleep(backoff_delay(attempt, *READ_BACKOFF))
         
         # Returns the last known value on failure
         return self._data_cache.get(slug)
 
+    async def get_values(self, slugs: Iterable[str]) -> Dict[str, Any]:
+        """Asynchronously fetches several parameter values in a single connection.
+
+        Requests are sent one after the other on the shared connection and each
+        response is matched to the request that precedes it. The batch stops at
+        the first failed exchange, since a late answer would otherwise be
+        attributed to the next parameter. Parameters that could not be read are
+        left out of the result so the caller can decide how to retry them.
+
+        Args:
+            slugs: The string identifiers of the parameters.
+
+        Returns:
+            Dict[str, Any]: The values successfully read, keyed by slug.
+        """
+        params = {
+            slug: (self.params_map[slug]['id'], self._codecs[slug])
+            for slug in slugs if slug in self._codecs
+        }
+        values = {}
+        async with self._io_lock:
+            for slug, (pid, codec) in params.items():
+                resp = await self._transaction(CMD_READ_VAL, self._read_payload(pid))
+                if resp is None:
+                    break
+                val = self._parse_read_response(resp, codec)
+                if val is not None:
+                    values[slug] = val
+
+        self._data_cache.update(values)  # Caching
+        return values
+
     async def set_value(self, slug: str, value: Any, password: str = None, user: str = None) -> bool:
         """Asynchronously writes a parameter value.
 
@@ -160,94 +274,82 @@ class PlumDevice:
             bool: True if the write operation was confirmed by the device.
         """
         param = self.params_map.get(slug)
-        if not param: return False
+        codec = self._codecs.get(slug)
+        if not param or not codec: return False
         
         # Use stored credentials if not provided
         target_pass = password if password is not None else self.password
         target_user = user if user is not None else self.user
         
         pid = param['id']
-        encoded = self._encode(value, param)
-        if not encoded: return False
+        encoded = self._encode(value, codec)
+        if encoded is None: return False
 
         user_bytes = (target_user.encode('utf-8') + b'\x00') if target_user else b'\x00'
         pass_bytes = (target_pass.encode('utf-8') + b'\x00') if target_pass else b'\x00'
-        full_payload = user_bytes + pass_bytes + b'\x01' + struct.pack("<H", pid) + encoded
-
-        for attempt in range(1, 4):
-            if await asyncio.to_thread(self._sync_set_value, pid, full_payload):
+        full_payload = user_bytes + pass_bytes + b'\x01' + _PID_STRUCT.pack(pid) + encoded
+
+        attempts = 3
+        for attempt in range(1, attempts + 1):
+            async with self._io_lock:
+                self.session_id = (self.session_id + 1) % 65000
+                resp = await self._transaction(CMD_WRITE_FORCE, full_payload)
+            if resp is not None:
                 return True
-            await asyncio.sleep(1.0)
+            if attempt < attempts:
+                await asyncio.sleep(backoff_delay(attempt, *WRITE_BACKOFF))
         return False
 
-    # --- SYNC WORKERS ---
-    def _sync_get_value(self, pid: int, param: dict) -> Any:
-        """Blocking worker to fetch a single value."""
+    async def async_close(self) -> None:
+        """Closes the connection to the device."""
+        async with self._io_lock:
+            await self._transport.close()
+
+    # --- FRAMES ---
+    def _read_payload(self, pid: int) -> bytes:
+        """Constructs the payload of a read request for a single parameter ID."""
         self.session_id = (self.session_id + 1) % 65000
-        payload = struct.pack("<HB BH", self.session_id, 1, 1, pid)
-        frame = self._build_frame(CMD_READ_VAL, payload)
-        resp = self._socket_transaction(frame)
-        
+        return _READ_STRUCT.pack(self.session_id, 1, 1, pid)
+
+    def _parse_read_response(self, resp: Optional[bytes], codec: Codec) -> Any:
+        """Extracts the value from a read response payload."""
         if resp and len(resp) > 7:
-            # Simple extraction without extensive verification for the example
-            return self._decode(resp[7:], param)
+            # The value follows the 7-byte echo of the request; read in place
+            return self._decode(resp, codec, 7)
         return None
 
-    def _sync_set_value(self, pid: int, payload: bytes) -> bool:
-        """Blocking worker to write a value."""
-        self.session_id = (self.session_id + 1) % 65000
-        frame = self._build_frame(CMD_WRITE_FORCE, payload)
-        resp = self._socket_transaction(frame)
-        return resp is not None
-
-    def _build_frame(self, cmd, payload):
-        """Constructs the full binary frame (Header + Body + CRC)."""
-        l_val = 5 + len(payload)
-        header = struct.pack("<HHHB", l_val, DEST_ID, SOURCE_ID, cmd)
-        body = header + payload
-        chk = self._crc16(body)
-        return b'\x68' + body + struct.pack(">H", chk) + b'\x16'
-    
-    def _crc16(self, data: bytes) -> int:
-        """Calculates the CRC16 checksum for the frame."""
-        crc = 0x0000
-        poly = 0x1021
-        for b in data:
-            crc ^= (b << 8)
-            for _ in range(8):
-                if crc & 0x8000: crc = (crc << 1) ^ poly
-                else: crc <<= 1
-                crc &= 0xFFFF
-        return crc
-
-    def _socket_transaction(self, frame: bytes) -> Optional[bytes]:
-        """Executes a raw TCP transaction (Connect -> Send -> Receive -> Close).
+    async def _transaction(self, cmd: int, payload: bytes) -> Optional[bytes]:
+        """Sends a frame on the shared connection, reconnecting if needed.
+
+        Must be called with `_io_lock` held. Any error or timeout drops the
+        connection so the next call starts from a fresh one.
 
         Args:
-            frame: The binary frame to send.
+            cmd: The function code of the request.
+            payload: The request payload.
 
         Returns:
-            bytes: The response payload if successful, None otherwise.
+            bytes: The payload of the device's reply to `cmd` if successful,
+            None otherwise.
         """
-        sock = None
+        transport = self._transport
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2.0)
-            sock.connect((self.ip, self.port))
-            sock.send(frame)
-            
-            buffer = bytearray()
-            start = time.time()
-            while time.time() - start < 2.0:
-                chunk = sock.recv(1024)
-                if not chunk: break
-                buffer.extend(chunk)
-                if b'\x68' in buffer and buffer.endswith(b'\x16'):
-                     # Simplified search for header 0x68
-                     idx = buffer.find(b'\x68')
-                     return buffer[idx+8:-3] # Returns payload
-            return None
-        except:
+            if not transport.connected:
+                await asyncio.wait_for(transport.connect(), IO_TIMEOUT)
+            frame = await transport.request(
+                BoilerFrame(DEST_ID, SOURCE_ID, cmd, payload), timeout=IO_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.debug(f"Connection error, dropping connection: {e}")
+            frame = None
+
+        # Only a reply to this request counts: a stray frame or a NAK must not
+        # pass for an acknowledgement or be matched to the next request
+        if frame is not None and (frame.dest != SOURCE_ID or frame.func != cmd | REPLY_FLAG):
+            logger.debug(f"Unexpected frame {frame.func:#04x} for {frame.dest}, dropping connection")
+            frame = None
+
+        if frame is None:
+            await transport.close()
             return None
-        finally:
-            if sock: sock.close()
\ No newline at end of file
+        return frame.data
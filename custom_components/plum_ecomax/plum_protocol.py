@@ -4,6 +4,7 @@ This module defines the data structures used to represent boiler parameters
 and network frames. It also contains the CRC-16 algorithm used to verify
 data integrity over the RS-485/TCP connection.
 """
+import binascii
 import struct
 from dataclasses import dataclass
 from typing import ClassVar, Any
@@ -12,6 +13,15 @@ from typing import ClassVar, Any
 START_BYTE = 0x68
 STOP_BYTE = 0x16
 
+# Frame layouts: header (L, dest, src, func) little endian, CRC big endian
+_HEADER_STRUCT = struct.Struct("<HHHB")
+_ADDR_STRUCT = struct.Struct("<HH")
+_CRC_STRUCT = struct.Struct(">H")
+
+# Powers of ten for the supported exponents: POW10[exp + POW10_BIAS] == 10 ** exp
+POW10_BIAS = 9
+POW10 = tuple(10.0 ** i for i in range(-POW10_BIAS, POW10_BIAS + 1))
+
 # Type mapping according to Spec 1.4.2
 DATA_TYPES = {
     0x01: ("SHORT INT", 1), 0x02: ("INT", 2), 0x03: ("LONG INT", 4),
@@ -24,23 +34,17 @@ def compute_crc16(data: bytes) -> int:
     """Calculates the CRC-16/CCITT checksum.
 
     Used by the ecoNET protocol to verify frame integrity.
-    Polynomial: 0x1021.
+    Polynomial: 0x1021, initial value 0, no reflection (CRC-16/XMODEM), which
+    is exactly what the C implementation of `binascii.crc_hqx` computes.
 
     Args:
-        data: The raw bytes to calculate the checksum for.
+        data: The raw bytes to calculate the checksum for (any bytes-like
+            object, so a memoryview slice is checked without copying).
 
     Returns:
         int: The calculated 16-bit checksum.
     """
-    crc = 0x0000
-    poly = 0x1021
-    for b in data:
-        crc ^= (b << 8)
-        for _ in range(8):
-            if crc & 0x8000: crc = (crc << 1) ^ poly
-            else: crc <<= 1
-            crc &= 0xFFFF
-    return crc
+    return binascii.crc_hqx(data, 0)
 
 @dataclass
 class BoilerParameter:
@@ -113,6 +117,8 @@ class BoilerParameter:
         if isinstance(raw_value, (int, float)) and self.exponent != 0:
             # U2 code for the exponent (handles negatives)
             exp = self.exponent
+            if -POW10_BIAS <= exp <= POW10_BIAS:
+                return raw_value * POW10[exp + POW10_BIAS]
             return raw_value * (10 ** exp)
         return raw_value
 
@@ -145,23 +151,38 @@ class BoilerFrame:
     def to_bytes(self) -> bytes:
         """Serializes the frame into bytes for transmission.
 
+        Returns:
+            bytes: The full binary frame ready to be sent over TCP.
+        """
+        return bytes(self.to_bytearray())
+
+    def to_bytearray(self) -> bytearray:
+        """Serializes the frame into a new, mutable buffer.
+
         Adds the header (Length, Dest, Src, Func), calculates the CRC,
-        and adds Start/Stop bytes.
+        and adds Start/Stop bytes. The transport writes this buffer as is,
+        without the copy into an immutable bytes object.
 
         Returns:
-            bytes: The full binary frame ready to be sent over TCP.
+            bytearray: The full binary frame ready to be sent over TCP.
         """
         # L = Dest(2) + Src(2) + Func(1) + Data(n)
-        l_val = 2 + 2 + 1 + len(self.data)
+        size = len(self.data)
+        l_val = 2 + 2 + 1 + size
+        crc_at = 8 + size
 
+        # Start(1) + Header(7) + Data(n) + CRC(2) + Stop(1), filled in place
+        buf = bytearray(crc_at + 3)
+        buf[0] = START_BYTE
         # Header (Little Endian)
-        header = struct.pack("<HHHB", l_val, self.dest, self.src, self.func)
-        body = header + self.data
+        _HEADER_STRUCT.pack_into(buf, 1, l_val, self.dest, self.src, self.func)
+        buf[8:crc_at] = self.data
 
         # CRC (Big Endian >H over the network!)
-        crc = compute_crc16(body)
-
-        return struct.pack("B", START_BYTE) + body + struct.pack(">H", crc) + struct.pack("B", STOP_BYTE)
+        crc = compute_crc16(memoryview(buf)[1:crc_at])
+        _CRC_STRUCT.pack_into(buf, crc_at, crc)
+        buf[-1] = STOP_BYTE
+        return buf
 
     @classmethod
     def from_bytes(cls, data: bytes) -> 'BoilerFrame':
@@ -175,8 +196,7 @@ class BoilerFrame:
         """
         # data must be the body (without start/stop/crc/len)
         # Received Body Structure: Dest(2) Src(2) Func(1) Payload(n)
-        dest = struct.unpack("<H", data[0:2])[0]
-        src = struct.unpack("<H", data[2:4])[0]
+        dest, src = _ADDR_STRUCT.unpack_from(data)
         func = data[4]
         payload = data[5:]
         return cls(dest, src, func, payload)
\ No newline at end of file
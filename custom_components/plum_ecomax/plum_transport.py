@@ -10,11 +10,145 @@ asyncio. It is responsible for:
 import asyncio
 import struct
 import logging
-from typing import Optional, List
-from .plum_utils import BoilerFrame, START_BYTE, STOP_BYTE, compute_crc16
+from typing import Optional, List, Tuple
+from .plum_protocol import BoilerFrame, START_BYTE, STOP_BYTE, compute_crc16
 
 logger = logging.getLogger(__name__)
 
+# Header after the start byte: L, dest, src, func (little endian)
+_HEADER_STRUCT = struct.Struct("<HHHB")
+_unpack_header = _HEADER_STRUCT.unpack_from
+HEADER_END = 1 + _HEADER_STRUCT.size
+# CRC (big endian)
+_unpack_u16be = struct.Struct(">H").unpack_from
+
+# Capacity of the receive buffer; longer frames are treated as noise
+RECV_BUFFER_SIZE = 65536
+
+class ReceiveBuffer:
+    """Fixed-size receive buffer with read (head) and write (tail) cursors.
+
+    Consuming bytes advances the head instead of shifting the remaining data
+    down; the pending bytes are moved back to the start only when the free
+    space at the end runs out.
+
+    Attributes:
+        data (bytearray): The storage, never resized.
+        view (memoryview): A view of `data`, for zero-copy slices.
+        head (int): Offset of the first unread byte.
+        tail (int): Offset just past the last received byte.
+    """
+
+    __slots__ = ("data", "view", "head", "tail")
+
+    def __init__(self, size: int = RECV_BUFFER_SIZE):
+        """Initializes an empty buffer.
+
+        Args:
+            size: The capacity in bytes.
+        """
+        self.data = bytearray(size)
+        self.view = memoryview(self.data)
+        self.head = 0
+        self.tail = 0
+
+    def __len__(self) -> int:
+        """Returns the number of unread bytes."""
+        return self.tail - self.head
+
+    def clear(self) -> None:
+        """Drops every unread byte."""
+        self.head = self.tail = 0
+
+    def consume(self, nbytes: int) -> None:
+        """Marks `nbytes` bytes as read."""
+        self.head += nbytes
+        if self.head == self.tail:
+            self.clear()
+
+    def writable(self) -> memoryview:
+        """Returns the free space after the received bytes, compacting if needed."""
+        if self.tail == len(self.data):
+            if self.head == 0:
+                self.clear()  # Full without a single frame: drop it all
+            else:
+                pending = self.tail - self.head
+                self.data[:pending] = self.view[self.head:self.tail]
+                self.head, self.tail = 0, pending
+        return self.view[self.tail:]
+
+    def commit(self, nbytes: int) -> None:
+        """Marks `nbytes` bytes written into `writable()` as received."""
+        self.tail += nbytes
+
+class PlumProtocol(asyncio.BufferedProtocol):
+    """Receives the TCP stream into the transport's parse buffer.
+
+    The event loop reads straight into the free space of the shared
+    `ReceiveBuffer` (`get_buffer`), instead of going through a StreamReader
+    and intermediate bytes objects.
+    """
+
+    __slots__ = ("_buffer", "_waiter", "_closed")
+
+    def __init__(self, buffer: ReceiveBuffer):
+        """Initializes the protocol.
+
+        Args:
+            buffer: The parse buffer the stream is received into.
+        """
+        self._buffer = buffer
+        self._waiter: Optional[asyncio.Future] = None
+        self._closed = asyncio.get_running_loop().create_future()
+
+    @property
+    def is_closed(self) -> bool:
+        """Returns True once the connection is lost."""
+        return self._closed.done()
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        """Returns the buffer the event loop receives into."""
+        return self._buffer.writable()
+
+    def buffer_updated(self, nbytes: int) -> None:
+        """Records the received bytes and wakes the reader."""
+        self._buffer.commit(nbytes)
+        self._wake()
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Marks the connection closed and wakes the reader."""
+        if not self._closed.done():
+            self._closed.set_result(None)
+        self._wake()
+
+    def _wake(self) -> None:
+        """Resolves the pending `wait_for_size` call, if any."""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def wait_for_size(self, size: int) -> bool:
+        """Waits until the parse buffer holds at least `size` bytes.
+
+        Args:
+            size: The buffer length to wait for.
+
+        Returns:
+            bool: False if the connection was lost first.
+        """
+        while len(self._buffer) < size:
+            if self._closed.done():
+                return False
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return True
+
+    async def wait_closed(self) -> None:
+        """Waits until the connection is lost."""
+        await asyncio.shield(self._closed)
+
 class AsyncPlumTransport:
     """Manages the asynchronous TCP connection to the ecomax module.
 
@@ -22,6 +156,8 @@ class AsyncPlumTransport:
     are reassembled correctly and that invalid data (noise) is discarded.
     """
 
+    __slots__ = ("host", "port", "_transport", "_protocol", "_buffer")
+
     def __init__(self, host: str, port: int):
         """Initializes the transport layer.
 
@@ -31,9 +167,14 @@ class AsyncPlumTransport:
         """
         self.host = host
         self.port = port
-        self.reader: Optional[asyncio.StreamReader] = None
-        self.writer: Optional[asyncio.StreamWriter] = None
-        self._buffer = bytearray()
+        self._transport: Optional[asyncio.Transport] = None
+        self._protocol: Optional[PlumProtocol] = None
+        self._buffer = ReceiveBuffer()
+
+    @property
+    def connected(self) -> bool:
+        """Returns True while the TCP connection is open."""
+        return self._protocol is not None and not self._protocol.is_closed
 
     async def connect(self):
         """Establishes the TCP connection.
@@ -42,15 +183,19 @@ class AsyncPlumTransport:
             OSError: If the connection fails (timeout, refused, etc.).
         """
         logger.debug(f"Connecting to {self.host}:{self.port}")
-        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self._buffer.clear()
+        self._transport, self._protocol = await asyncio.get_running_loop().create_connection(
+            lambda: PlumProtocol(self._buffer), self.host, self.port
+        )
 
     async def close(self):
         """Closes the TCP connection and clears resources."""
-        if self.writer:
-            self.writer.close()
-            await self.writer.wait_closed()
-        self.reader = None
-        self.writer = None
+        transport, self._transport = self._transport, None
+        protocol, self._protocol = self._protocol, None
+        self._buffer.clear()
+        if transport:
+            transport.close()
+            await protocol.wait_closed()
 
     async def send_frame(self, frame: BoilerFrame):
         """Serializes and sends a frame over the network.
@@ -61,17 +206,37 @@ class AsyncPlumTransport:
         Raises:
             ConnectionError: If the socket is not connected.
         """
-        if not self.writer:
+        if not self.connected:
             raise ConnectionError("Not connected")
 
-        packet = frame.to_bytes()
+        packet = frame.to_bytearray()
         # Flush input buffer before sending (Strategy from working script)
         self._buffer.clear()
         # Note: real socket flush is hard in asyncio without reading,
         # but clearing our parser buffer helps.
 
-        self.writer.write(packet)
-        await self.writer.drain()
+        # Frames are a few dozen bytes: the transport buffers them without
+        # needing flow control
+        self._transport.write(packet)
+
+    async def request(self, frame: BoilerFrame, timeout: float = 2.0) -> Optional[BoilerFrame]:
+        """Sends a frame and reads the response in one exchange.
+
+        The write is handed to the transport without waiting for it to be
+        flushed, so the response wait starts in the same event loop turn.
+
+        Args:
+            frame: The BoilerFrame object to send.
+            timeout: Maximum time to wait for the response in seconds.
+
+        Returns:
+            Optional[BoilerFrame]: The response frame, or None if timeout/error occurs.
+
+        Raises:
+            ConnectionError: If the socket is not connected.
+        """
+        await self.send_frame(frame)
+        return await self.read_frame(timeout)
 
     async def read_frame(self, timeout: float = 2.0) -> Optional[BoilerFrame]:
         """Reads the stream until a valid frame is found or timeout occurs.
@@ -79,7 +244,8 @@ class AsyncPlumTransport:
         This method handles TCP stream processing:
         1.  It reads chunks of data into a persistent buffer.
         2.  It scans for the START_BYTE (0x68).
-        3.  It parses the header to determine the expected frame length.
+        3.  It parses the header to determine the expected frame length, then
+            waits for exactly the missing bytes.
         4.  It verifies the CRC and STOP_BYTE.
 
         Args:
@@ -91,75 +257,82 @@ class AsyncPlumTransport:
         Raises:
             ConnectionError: If the socket is not connected.
         """
-        if not self.reader:
+        protocol = self._protocol
+        if protocol is None:
             raise ConnectionError("Not connected")
 
-        start_time = asyncio.get_running_loop().time()
+        try:
+            async with asyncio.timeout(timeout):
+                while True:
+                    frame, missing = self._parse_buffer()
+                    if frame is not None:
+                        return frame
 
-        while (asyncio.get_running_loop().time() - start_time) < timeout:
-            try:
-                # Read in small chunks
-                chunk = await asyncio.wait_for(self.reader.read(1024), timeout=0.5)
-                if not chunk:
-                    return None
-                self._buffer.extend(chunk)
+                    # Length known from the header: wait for exactly the rest,
+                    # otherwise for any new data
+                    if not await protocol.wait_for_size(len(self._buffer) + max(missing, 1)):
+                        return None
 
-                # Parsing
-                while True:
-                    try:
-                        start_idx = self._buffer.index(START_BYTE)
-                    except ValueError:
-                        self._buffer.clear()
-                        break  # No start byte, waiting for more data
-
-                    # Align the buffer
-                    if start_idx > 0:
-                        del self._buffer[:start_idx]
-
-                    # Minimum header: 68 L L
-                    if len(self._buffer) < 3:
-                        break
-
-                    l_val = struct.unpack("<H", self._buffer[1:3])[0]
-                    total_len = (
-                        l_val + 6
-                    )  # 68 + L(2) + Content(L) + CRC(2) + 16
-
-                    if len(self._buffer) < total_len:
-                        break  # Incomplete frame, waiting
-
-                    # Extraction
-                    frame_bytes = self._buffer[:total_len]
-
-                    # CRC Validation
-                    # Body for CRC = L(2) + Content(L) => indices 1 to 1+2+L
-                    body_end = 1 + 2 + l_val
-                    body = frame_bytes[1:body_end]
-
-                    received_crc = struct.unpack(
-                        ">H", frame_bytes[body_end : body_end + 2]
-                    )[0]
-
-                    if (
-                        compute_crc16(body) == received_crc
-                        and frame_bytes[-1] == STOP_BYTE
-                    ):
-                        # Valid Frame!
-                        # Extract internal content: Dest, Src, Func, Data
-                        # Body contains: L(2) Dest(2) Src(2) Func(1) Payload...
-                        # We pass body[2:] to from_bytes because from_bytes expects Dest...
-                        valid_frame = BoilerFrame.from_bytes(body[2:])
-
-                        del self._buffer[:total_len]  # Consume
-                        return valid_frame
-                    else:
-                        # Invalid CRC, discard the StartByte and retry
-                        del self._buffer[0]
-
-            except asyncio.TimeoutError:
+        except asyncio.TimeoutError:
+            return None
+        except Exception as e:
+            logger.error(f"Transport error: {e}")
+            return None
+
+    def _parse_buffer(self) -> Tuple[Optional[BoilerFrame], int]:
+        """Extracts the first valid frame from the receive buffer.
+
+        Noise before a START_BYTE and frames failing the CRC/STOP_BYTE checks
+        are discarded.
+
+        Returns:
+            Tuple[Optional[BoilerFrame], int]: The frame if one is complete,
+            otherwise None and the number of bytes still missing from the
+            pending frame or its header (0 while no start byte is found).
+        """
+        buf = self._buffer
+        data = buf.data
+        while True:
+            # The head only moves forward, so each byte is scanned once
+            start_idx = data.find(START_BYTE, buf.head, buf.tail)
+            if start_idx < 0:
+                buf.clear()
+                return None, 0  # No start byte, waiting for more data
+
+            # Align the buffer
+            buf.head = start_idx
+            available = buf.tail - start_idx
+
+            # Full header: 68 L L Dest Dest Src Src Func
+            if available < HEADER_END:
+                return None, HEADER_END - available
+
+            # Header fields in one read, the frame is built from them directly
+            l_val, dest, src, func = _unpack_header(data, start_idx + 1)
+            total_len = l_val + 6  # 68 + L(2) + Content(L) + CRC(2) + 16
+
+            if l_val < 5 or total_len > len(data):
+                # Shorter than its own header, or cannot fit: not a real frame
+                buf.consume(1)
                 continue
-            except Exception as e:
-                logger.error(f"Transport error: {e}")
-                return None
 
-        return None
\ No newline at end of file
+            if available < total_len:
+                return None, total_len - available  # Incomplete frame
+
+            # CRC Validation
+            # Body for CRC = L(2) + Content(L) => indices 1 to 1+2+L
+            body_end = start_idx + 3 + l_val
+            received_crc = _unpack_u16be(data, body_end)[0]
+
+            if (
+                compute_crc16(buf.view[start_idx + 1 : body_end]) == received_crc
+                and data[start_idx + total_len - 1] == STOP_BYTE
+            ):
+                # Valid Frame! Only the payload is copied out of the buffer
+                valid_frame = BoilerFrame(dest, src, func, bytes(buf.view[start_idx + HEADER_END : body_end]))
+
+                buf.consume(total_len)
+                return valid_frame, 0
+
+            # Invalid CRC, discard the StartByte and retry
+            buf.consume(1)
@@ -5,14 +5,14 @@ for parameters that have a discrete set of options, such as the DHW mode
 (Off, Manual, Auto) or other enumerated settings.
 """
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SELECT_TYPES
+from .const import DOMAIN, SELECT_TYPES, SELECT_TYPES_ITEMS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,14 +32,16 @@ async def async_setup_entry(
         async_add_entities: Callback to add entities to Home Assistant.
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
+    keys = coordinator.device.params_keys
 
-    # Config format: "slug": ("Name", Map_To_HA, Map_To_Plum)
-    for slug, (name, map_to_ha, map_to_plum) in SELECT_TYPES.items():
-        if slug in coordinator.device.params_map:
-            entities.append(PlumEconetSelect(coordinator, slug, name, map_to_ha, map_to_plum))
-        else:
-            _LOGGER.debug(f"Select '{slug}' not found in device map, skipping.")
+    # Row format: (slug, "Name", Map_To_HA, Map_To_Plum, Options)
+    entities = [
+        PlumEconetSelect(coordinator, slug, name, map_to_ha, map_to_plum, options)
+        for slug, name, map_to_ha, map_to_plum, options in SELECT_TYPES_ITEMS
+        if slug in keys
+    ]
+    if skipped := SELECT_TYPES.keys() - keys:
+        _LOGGER.debug(f"Selects {sorted(skipped)} not found in device map, skipping.")
 
     async_add_entities(entities)
 
@@ -52,7 +54,15 @@ class PlumEconetSelect(CoordinatorEntity, SelectEntity):
     """
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator, slug: str, name: str, map_to_ha: Dict[int, str], map_to_plum: Dict[str, int]):
+    def __init__(
+        self,
+        coordinator,
+        slug: str,
+        name: str,
+        map_to_ha: Dict[int, str],
+        map_to_plum: Dict[str, int],
+        options: Optional[List[str]] = None,
+    ):
         """Initializes the select entity.
 
         Args:
@@ -61,6 +71,8 @@ class PlumEconetSelect(CoordinatorEntity, SelectEntity):
             name: The friendly name of the entity.
             map_to_ha: Dictionary mapping Integer (Plum) -> String (Home Assistant).
             map_to_plum: Dictionary mapping String (Home Assistant) -> Integer (Plum).
+            options: Precomputed option list (the keys of `map_to_plum`), shared
+                between entities of the same type.
         """
         super().__init__(coordinator)
         self._slug = slug
@@ -72,7 +84,7 @@ class PlumEconetSelect(CoordinatorEntity, SelectEntity):
         self._map_to_plum = map_to_plum
         
         # Define available options based on the mapping keys
-        self._attr_options = list(map_to_plum.keys())
+        self._attr_options = options if options is not None else list(map_to_plum)
 
     @property
     def current_option(self) -> str | None:
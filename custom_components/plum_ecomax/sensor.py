@@ -13,12 +13,20 @@ import math  # <--- CRITICAL: Import required for NaN checks
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import DOMAIN, SENSOR_TYPES, CONF_ACTIVE_CIRCUITS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Circuit number embedded in a slug (e.g., tempcircuit1 -> 1)
+_CIRCUIT_RE = re.compile(r'(circuit|mixer)(\d+)')
+
+def _circuit_id(slug: str) -> str | None:
+    """Returns the circuit number of a circuit/mixer slug, None otherwise."""
+    match = _CIRCUIT_RE.search(slug)
+    return match.group(2) if match else None
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -38,26 +46,16 @@ async def async_setup_entry(
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
     selected_circuits = entry.data.get(CONF_ACTIVE_CIRCUITS, [])
-    entities = []
-
-    for slug, config in SENSOR_TYPES.items():
-        # Skip if the parameter is not present on the device
-        if slug not in coordinator.device.params_map:
-            continue
+    keys = coordinator.device.params_keys
 
-        target_circuit_id = None
-        # Automatic circuit detection via Regex (e.g., tempcircuit1 -> 1)
-        match = re.search(r'(circuit|mixer)(\d+)', slug)
-        
-        if match:
-            found_id = match.group(2)
-            # If it's a circuit sensor, verify if this circuit is enabled in config
-            if found_id in selected_circuits:
-                target_circuit_id = found_id
-            else:
-                continue 
-
-        entities.append(PlumEcomaxSensor(coordinator, entry, slug, config, target_circuit_id))
+    # Skip parameters not present on the device; circuit sensors are kept
+    # only if their circuit is enabled in the configuration
+    circuit_of = {slug: _circuit_id(slug) for slug in SENSOR_TYPES if slug in keys}
+    entities = [
+        PlumEcomaxSensor(coordinator, entry, slug, SENSOR_TYPES[slug], circuit_id)
+        for slug, circuit_id in circuit_of.items()
+        if circuit_id is None or circuit_id in selected_circuits
+    ]
 
     if entities:
         async_add_entities(entities)
@@ -79,58 +77,71 @@ class PlumEcomaxSensor(CoordinatorEntity, SensorEntity):
             coordinator: The data update coordinator.
             entry: The config entry.
             slug: The parameter identifier.
-            config: A tuple containing (unit, icon, device_class).
+            config: The SensorSpec (unit, icon, device_class) from const.py.
             circuit_id: Optional ID to link to a specific circuit device.
         """
         super().__init__(coordinator)
         self._slug = slug
         self._attr_translation_key = slug
+        self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{slug}"
         
         # Unpack configuration from const.py
-        self._unit = config[0]
-        self._icon = config[1]
-        self._device_class = config[2]
-        
-        self._entry_id = entry.entry_id
-        self._circuit_id = circuit_id
+        self._attr_native_unit_of_measurement = config.unit
+        self._attr_icon = config.icon
+        self._attr_device_class = config.device_class
 
-    @property
-    def unique_id(self) -> str:
-        """Returns the unique ID of the sensor.
+        # If a Device Class or Unit is defined, we expect a number
+        self._is_numeric = bool(config.device_class or config.unit)
+        # Only set state_class for numeric sensors
+        if self._is_numeric:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+
+        # Link to the correct device (Boiler or specific Circuit)
+        if circuit_id:
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, f"{entry.entry_id}_circuit_{circuit_id}")},
+                "name": f"Circuit {circuit_id}",
+                "manufacturer": "Plum",
+                "via_device": (DOMAIN, entry.entry_id),
+            }
+        else:
+            self._attr_device_info = {
+                "identifiers": {(DOMAIN, entry.entry_id)},
+                "name": "Plum EcoMAX Boiler",
+                "manufacturer": "Plum",
+            }
 
-        Returns:
-            str: The unique identifier.
-        """
-        return f"{DOMAIN}_{self._entry_id}_{self._slug}"
+        self._update_native_value()
 
-    @property
-    def native_value(self) -> float | str | None:
-        """Returns the sensor value with safety checks.
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refreshes the cached value when the coordinator publishes new data."""
+        self._update_native_value()
+        super()._handle_coordinator_update()
 
-        CRITICAL FIX: Filters out 'NaN' (Not a Number) values to prevent HA crash.
+    def _update_native_value(self) -> None:
+        """Stores the sensor value with safety checks.
 
-        Returns:
-            float | str | None: The sanitized value.
+        CRITICAL FIX: Filters out 'NaN' (Not a Number) values to prevent HA crash.
+        The sanitized value is kept in `_attr_native_value`, so state reads
+        between two updates don't touch the coordinator data.
         """
         val = self.coordinator.data.get(self._slug)
-        
-        if val is None:
-            return None
 
         # If a Device Class or Unit is defined, we expect a number
-        if self._device_class or self._unit:
+        if val is not None and self._is_numeric:
             try:
-                f_val = float(val)
-                # Check if value is NaN or Infinite -> Return None (Unavailable)
-                if math.isnan(f_val) or math.isinf(f_val):
-                    return None
-                return f_val
+                val = float(val)
             except (ValueError, TypeError):
-                # Conversion failed but a number was expected -> Return None
-                return None
-        
-        # For text sensors, return the value as is
-        return val
+                # Conversion failed but a number was expected -> None
+                val = None
+
+        # NaN or Infinite -> None (Unavailable). Polled values are already
+        # rejected by the coordinator; this covers data that bypassed it.
+        if isinstance(val, float) and not math.isfinite(val):
+            val = None
+
+        self._attr_native_value = val
 
     @property
     def available(self) -> bool:
@@ -139,56 +150,6 @@ class PlumEcomaxSensor(CoordinatorEntity, SensorEntity):
         Returns:
             bool: False if data is missing or NaN, True otherwise.
         """
-        val = self.coordinator.data.get(self._slug)
-        if val is None:
-            return False
-        
-        # If it's a number, check for NaN
-        if isinstance(val, float) and math.isnan(val):
+        if self._attr_native_value is None:
             return False
-            
         return super().available
-
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Returns the unit of measurement."""
-        return self._unit
-
-    @property
-    def icon(self) -> str | None:
-        """Returns the icon."""
-        return self._icon
-
-    @property
-    def device_class(self) -> str | None:
-        """Returns the device class."""
-        return self._device_class
-
-    @property
-    def state_class(self) -> SensorStateClass | None:
-        """Returns the state class (Measurement for numbers)."""
-        # Only set state_class for numeric sensors
-        if self._device_class or self._unit:
-            return SensorStateClass.MEASUREMENT
-        return None
-
-    @property
-    def device_info(self) -> dict:
-        """Links the sensor to the correct device (Boiler or specific Circuit).
-
-        Returns:
-            dict: The device info dictionary.
-        """
-        if self._circuit_id:
-            return {
-                "identifiers": {(DOMAIN, f"{self._entry_id}_circuit_{self._circuit_id}")},
-                "name": f"Circuit {self._circuit_id}",
-                "manufacturer": "Plum",
-                "via_device": (DOMAIN, self._entry_id),
-            }
-        else:
-            return {
-                "identifiers": {(DOMAIN, self._entry_id)},
-                "name": "Plum EcoMAX Boiler",
-                "manufacturer": "Plum",
-            }
\ No newline at end of file
@@ -8,7 +8,7 @@ import logging
 from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -32,14 +32,16 @@ async def async_setup_entry(
         async_add_entities: Callback to add entities to Home Assistant.
     """
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    entities = []
+    keys = coordinator.device.params_keys
 
-    for slug, name in SWITCH_TYPES.items():
-        # We only create the entity if the parameter exists on the device
-        if slug in coordinator.device.params_map:
-            entities.append(PlumEconetSwitch(coordinator, slug, name))
-        else:
-            _LOGGER.debug(f"Switch '{slug}' not found in device map, skipping.")
+    # We only create the entity if the parameter exists on the device
+    entities = [
+        PlumEconetSwitch(coordinator, slug, name)
+        for slug, name in SWITCH_TYPES.items()
+        if slug in keys
+    ]
+    if skipped := SWITCH_TYPES.keys() - keys:
+        _LOGGER.debug(f"Switches {sorted(skipped)} not found in device map, skipping.")
 
     async_add_entities(entities)
 
@@ -66,18 +68,21 @@ class PlumEconetSwitch(CoordinatorEntity, SwitchEntity):
         self._attr_translation_key = slug
         self._attr_unique_id = f"{DOMAIN}_{slug}"
 
-    @property
-    def is_on(self) -> bool:
-        """Checks if the switch is currently on.
+        self._update_is_on()
 
-        Returns:
-            bool: True if the parameter value is 1, False otherwise.
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refreshes the cached state when the coordinator publishes new data."""
+        self._update_is_on()
+        super()._handle_coordinator_update()
+
+    def _update_is_on(self) -> None:
+        """Stores whether the switch is on, i.e. the parameter value is 1.
+
+        A plain comparison covers int and float values; anything else
+        (None included) reads as off.
         """
-        val = self.coordinator.data.get(self._slug)
-        try:
-            return int(val) == 1
-        except (ValueError, TypeError):
-            return False
+        self._attr_is_on = self.coordinator.data.get(self._slug) == 1
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turns the switch on.
@@ -16,7 +16,7 @@ from homeassistant.components.water_heater import (
     STATE_PERFORMANCE,
 )
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature, PRECISION_WHOLE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
@@ -30,6 +30,27 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Limits used while the device does not report its own
+DEFAULT_MIN_TEMP = 20.0
+DEFAULT_MAX_TEMP = 60.0
+
+def _to_float(val: Any) -> Optional[float]:
+    """Converts a coordinator value to a finite float, or None."""
+    try:
+        f_val = float(val)
+    except (ValueError, TypeError):
+        return None
+    return f_val if math.isfinite(f_val) else None
+
+def _to_mode(val: Any) -> Optional[int]:
+    """Normalizes a raw mode (int, float or numeric string) to its int code."""
+    if val.__class__ is int:
+        return val
+    try:
+        return int(val)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: Any,
@@ -119,103 +140,44 @@ class PlumEcomaxWaterHeater(CoordinatorEntity, WaterHeaterEntity):
         self._attr_unique_id = f"{DOMAIN}_{translation_key}"
         self._attr_has_entity_name = True
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Links this entity to the dedicated DHW device.
-
-        Returns:
-            DeviceInfo: The device info dictionary.
-        """
-        return DeviceInfo(
+        # Links this entity to the dedicated DHW device
+        self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, "plum_hdw")},
             name="DHW",
             manufacturer="Plum",
             model="DHW Manager",
         )
 
-    @property
-    def current_temperature(self) -> Optional[float]:
-        """Returns the current water temperature.
+        self._update_from_coordinator()
 
-        Includes checks for NaN (Not a Number) to prevent errors.
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refreshes the cached state when the coordinator publishes new data."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
-        Returns:
-            float | None: Current temperature or None if invalid.
-        """
-        val = self.coordinator.data.get(self._current_slug)
-        if val is None:
-            return None
-        try:
-            f_val = float(val)
-            if math.isnan(f_val): return None
-            return f_val
-        except (ValueError, TypeError):
-            return None
-
-    @property
-    def target_temperature(self) -> Optional[float]:
-        """Returns the current target temperature setpoint.
-
-        Returns:
-            float | None: The setpoint.
+    def _update_from_coordinator(self) -> None:
+        """Copies the tank values from the coordinator data.
+
+        Temperatures that are missing or not numbers (NaN included) read as
+        None. The limits are fetched dynamically from the device and fall back
+        to 20.0/60.0. The mode maps Plum codes to Home Assistant states
+        (0 -> Off, 1 -> Performance/Manual, 2 -> Eco/Auto), Off when unknown.
         """
-        val = self.coordinator.data.get(self._target_slug)
-        if val is None: return None
-        try: return float(val)
-        except: return None
+        data = self.coordinator.data
 
-    @property
-    def min_temp(self) -> float:
-        """Returns the minimum supported temperature.
+        self._attr_current_temperature = _to_float(data.get(self._current_slug))
+        self._attr_target_temperature = _to_float(data.get(self._target_slug))
 
-        Fetches the limit dynamically from the device. Falls back to 20.0
-        if the value is unavailable or NaN.
+        min_temp = _to_float(data.get(self._min_slug))
+        self._attr_min_temp = min_temp if min_temp is not None else DEFAULT_MIN_TEMP
+        max_temp = _to_float(data.get(self._max_slug))
+        self._attr_max_temp = max_temp if max_temp is not None else DEFAULT_MAX_TEMP
 
-        Returns:
-            float: The limit value.
-        """
-        val = self.coordinator.data.get(self._min_slug)
-        try: 
-            f = float(val)
-            if math.isnan(f): return 20.0
-            return f
-        except: return 20.0
-
-    @property
-    def max_temp(self) -> float:
-        """Returns the maximum supported temperature.
-
-        Fetches the limit dynamically from the device. Falls back to 60.0
-        if the value is unavailable or NaN.
-
-        Returns:
-            float: The limit value.
-        """
-        val = self.coordinator.data.get(self._max_slug)
-        try: 
-            f = float(val)
-            if math.isnan(f): return 60.0
-            return f
-        except: return 60.0
-
-    @property
-    def current_operation(self) -> Optional[str]:
-        """Returns the current operation mode.
-
-        Maps internal Plum codes to Home Assistant states:
-        - 0 -> Off
-        - 1 -> Performance (Manual)
-        - 2 -> Eco (Auto/Schedule)
-
-        Returns:
-            str: The current mode (STATE_OFF, STATE_PERFORMANCE, or STATE_ECO).
-        """
-        raw_mode = self.coordinator.data.get(self._mode_slug)
-        # If raw_mode is None (startup), return Off for safety
-        if raw_mode is None:
-            return STATE_OFF
-            
-        return PLUM_TO_HA_WATER_HEATER.get(raw_mode, STATE_OFF)
+        # If the mode is None (startup) or unknown, report Off for safety
+        self._attr_current_operation = PLUM_TO_HA_WATER_HEATER.get(
+            _to_mode(data.get(self._mode_slug)), STATE_OFF
+        )
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Sets the water target temperature.
@@ -1,11 +1,8 @@
 """Global fixtures for Plum EcoMAX integration tests."""
-import os
-import sys
 import pytest
 
-# CRITICAL: This adds the root directory to the Python path.
-# It allows tests to do: "from custom_components.plum_ecomax import ..."
-sys.path.append(os.getcwd())
+# The repository root is put on the Python path by pytest.ini, which allows
+# tests to do: "from custom_components.plum_ecomax import ..."
 
 # We removed 'auto_enable_custom_integrations' because we are using Mocks.
 # We don't need to load the full Home Assistant component logic for unit tests.
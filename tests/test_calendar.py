@@ -2,9 +2,10 @@
 import pytest
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 from custom_components.plum_ecomax.calendar import PlumEconetCalendar
-from custom_components.plum_ecomax.const import DOMAIN
+from custom_components.plum_ecomax.const import DOMAIN, WEEKDAY_TO_SLUGS
 
 # --- FIX: Helper pour ajouter une timezone UTC aux datetimes naïfs ---
 def mock_as_local(dt):
@@ -89,4 +90,94 @@ async def test_get_events_hdw_mapping(mock_coordinator, mock_entry):
         
     assert len(events) == 2
     assert events[0].summary == "Active"
-    assert events[0].end == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
\ No newline at end of file
+    assert events[0].end == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+async def get_events(calendar, start_date, end_date, as_local=mock_as_local):
+    """Runs async_get_events with `as_local` standing in for the HA time zone."""
+    with patch("custom_components.plum_ecomax.calendar.dt_util.as_local", side_effect=as_local):
+        return await calendar.async_get_events(MagicMock(), start_date, end_date)
+
+@pytest.mark.asyncio
+async def test_get_events_reuses_weekdays_across_range(mock_coordinator, mock_entry):
+    """Test that each weekday keeps its own runs over a range longer than a week."""
+    calendar = PlumEconetCalendar(mock_coordinator, mock_entry, "circuit", 1)
+    # Weekday k is Active during slot k only (k * 30 min after midnight)
+    for weekday, (am, pm) in WEEKDAY_TO_SLUGS.items():
+        mock_coordinator.data[f"circuit1{am}"] = 1 << weekday
+        mock_coordinator.data[f"circuit1{pm}"] = 0
+
+    # Monday 1 to Wednesday 10: Monday to Wednesday come round twice
+    start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    events = await get_events(calendar, start_date, datetime(2024, 1, 10, 12, tzinfo=timezone.utc))
+
+    active = [event.start for event in events if event.summary == "Active"]
+    assert active == [
+        start_date + timedelta(days=day, minutes=30 * (day % 7)) for day in range(10)
+    ]
+    # Monday's active slot opens the day (2 events), the others split it in 3
+    assert len(events) == 2 + 3 * 6 + 2 + 3 + 3
+
+@pytest.mark.asyncio
+async def test_get_events_skips_days_without_registers(mock_coordinator, mock_entry):
+    """Test that a missing or None register produces no events for that day."""
+    calendar = PlumEconetCalendar(mock_coordinator, mock_entry, "circuit", 1)
+    mock_coordinator.data.update({
+        "circuit1mondayam": 0, "circuit1mondaypm": 0,
+        "circuit1tuesdayam": None, "circuit1tuesdaypm": 0,
+        "circuit1wednesdayam": 0,  # No PM register
+    })
+
+    events = await get_events(
+        calendar,
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        datetime(2024, 1, 3, 23, 59, tzinfo=timezone.utc),
+    )
+
+    assert [(event.start, event.end) for event in events] == [
+        (datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 2, tzinfo=timezone.utc)),
+    ]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "value,summary", [(0, "Eco"), (0xFFFFFF, "Active")], ids=["all_eco", "all_active"]
+)
+async def test_get_events_uniform_day(mock_coordinator, mock_entry, value, summary):
+    """Test that a uniform day is a single event from midnight to midnight."""
+    calendar = PlumEconetCalendar(mock_coordinator, mock_entry, "circuit", 1)
+    mock_coordinator.data["circuit1mondayam"] = value
+    mock_coordinator.data["circuit1mondaypm"] = value
+
+    events = await get_events(
+        calendar,
+        datetime(2024, 1, 1, tzinfo=timezone.utc),
+        datetime(2024, 1, 1, 23, 59, tzinfo=timezone.utc),
+    )
+
+    assert [(event.summary, event.start, event.end) for event in events] == [
+        (summary, datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2024, 1, 2, tzinfo=timezone.utc)),
+    ]
+
+@pytest.mark.asyncio
+async def test_get_events_across_dst_change(mock_coordinator, mock_entry):
+    """Test that slot 48 lands on the next local midnight on a 23-hour day."""
+    paris = ZoneInfo("Europe/Paris")
+    calendar = PlumEconetCalendar(mock_coordinator, mock_entry, "circuit", 1)
+    # Sunday 2024-03-31 (clocks go forward) all Active, Monday all Eco
+    mock_coordinator.data.update({
+        "circuit1sundayam": 0xFFFFFF, "circuit1sundaypm": 0xFFFFFF,
+        "circuit1mondayam": 0, "circuit1mondaypm": 0,
+    })
+
+    events = await get_events(
+        calendar,
+        datetime(2024, 3, 31, tzinfo=paris),
+        datetime(2024, 4, 1, 23, 59, tzinfo=paris),
+        as_local=lambda dt: dt.astimezone(paris),
+    )
+
+    sunday, monday = events
+    assert sunday.end == monday.start == datetime(2024, 4, 1, tzinfo=paris)
+    # Same-zone subtraction is wall-clock: compare the elapsed time in UTC
+    utc = timezone.utc
+    assert sunday.end.astimezone(utc) - sunday.start.astimezone(utc) == timedelta(hours=23)
+    assert monday.end == datetime(2024, 4, 2, tzinfo=paris)
@@ -73,3 +73,59 @@ async def test_set_temperature_routing(climate_entity):
     await climate_entity.async_set_temperature(temperature=18)
     climate_entity.coordinator.async_set_value.assert_called_with("target_eco", 18)
 """
+
+def test_setpoint_bounds_from_device():
+    """Test that device-reported bounds override the 10-30 defaults."""
+    coordinator = MagicMock()
+    coordinator.data = {}
+    entry = MagicMock()
+    entry.entry_id = "12345"
+
+    entity = PlumEcomaxClimate(
+        coordinator, entry, 1, "cur", "target", "active", min_slug="min", max_slug="max"
+    )
+    assert (entity.min_temp, entity.max_temp) == (10.0, 30.0)
+
+    # Bounds reported after setup are applied on the next update
+    coordinator.data = {"min": 5, "max": 35}
+    entity._update_from_coordinator()
+    assert (entity.min_temp, entity.max_temp) == (5.0, 35.0)
+
+    # An inverted or partial range keeps the last usable one
+    coordinator.data = {"min": 40, "max": 35}
+    entity._update_from_coordinator()
+    assert (entity.min_temp, entity.max_temp) == (5.0, 35.0)
+    coordinator.data = {"max": 25}
+    entity._update_from_coordinator()
+    assert (entity.min_temp, entity.max_temp) == (5.0, 35.0)
+
+@pytest.mark.asyncio
+async def test_set_hvac_mode_dispatch(climate_entity):
+    """Test that HVAC modes map to the active flag and others are ignored."""
+    await climate_entity.async_set_hvac_mode(HVAC_MODE_HEAT)
+    climate_entity.coordinator.async_set_value.assert_called_with("mode_slug", 1)
+
+    await climate_entity.async_set_hvac_mode(HVAC_MODE_OFF)
+    climate_entity.coordinator.async_set_value.assert_called_with("mode_slug", 0)
+
+    climate_entity.coordinator.async_set_value.reset_mock()
+    await climate_entity.async_set_hvac_mode(HVAC_MODE_AUTO)
+    climate_entity.coordinator.async_set_value.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_set_temperature_turns_on_in_one_push():
+    """Test that setting a temperature while Off writes both values at once."""
+    coordinator = MagicMock()
+    coordinator.data = {}
+    coordinator.async_set_values = AsyncMock(return_value=True)
+    entry = MagicMock()
+    entry.entry_id = "12345"
+
+    entity = PlumEcomaxClimate(
+        coordinator, entry, circuit_id=1,
+        current_slug="cur", target_slug="target", active_slug="active",
+    )
+    entity._attr_hvac_mode = HVAC_MODE_OFF
+
+    await entity.async_set_temperature(temperature=21.5)
+    coordinator.async_set_values.assert_called_once_with({"target": 21.5, "active": 1})
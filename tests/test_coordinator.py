@@ -1,79 +1,186 @@
 """Unit tests for the PlumDataUpdateCoordinator."""
+import time
 import pytest
-from unittest.mock import MagicMock, AsyncMock
-from custom_components.plum_ecomax.coordinator import PlumDataUpdateCoordinator
+from types import MappingProxyType
+from unittest.mock import MagicMock, AsyncMock, call
+from custom_components.plum_ecomax.const import ALL_KNOWN_SLUGS
+from custom_components.plum_ecomax.coordinator import PlumDataUpdateCoordinator, SlugCache
 
-# Mock class to simulate the PlumDevice behavior
+# We simulate a params_map with mixed configurations, shared read-only
+PARAMS_MAP = MappingProxyType({
+    "temp_strict_json": {"min": 10, "max": 50, "name": "Strict"},  # Has JSON limits
+    "temp_generic": {"name": "Generic"},                           # No JSON limits
+    "pressure_bar": {"name": "Pressure"},                          # Should use generic pressure limits
+})
+
+# Plain class to simulate the PlumDevice behavior; tests that assert on the
+# I/O calls patch in AsyncMocks themselves
 class MockDevice:
-    def __init__(self):
-        # We simulate a params_map with mixed configurations
-        self.params_map = {
-            "temp_strict_json": {"min": 10, "max": 50, "name": "Strict"},  # Has JSON limits
-            "temp_generic": {"name": "Generic"},                           # No JSON limits
-            "pressure_bar": {"name": "Pressure"},                          # Should use generic pressure limits
-        }
-        # Mock methods
-        self.get_value = AsyncMock()
-        self.set_value = AsyncMock()
-
-@pytest.fixture
-def coordinator(hass):
-    """Fixture to create a coordinator instance with a mocked device."""
-    device = MockDevice()
-    coord = PlumDataUpdateCoordinator(hass, device)
+    params_map = PARAMS_MAP
+    params_keys = frozenset(PARAMS_MAP)
+
+    async def get_values(self, slugs):
+        return {}
+
+    async def get_value(self, slug, retries=3):
+        return None
+
+    async def set_value(self, slug, value):
+        return False
+
+@pytest.fixture(scope="module")
+def coordinator():
+    """Fixture to create a coordinator instance with a mocked device.
+
+    Built once per module; `reset_coordinator` restores its state per test.
+    """
+    hass = MagicMock()
+    hass.data = {}
+    return PlumDataUpdateCoordinator(hass, MockDevice())
+
+@pytest.fixture(autouse=True)
+def reset_coordinator(coordinator):
+    """Resets the shared coordinator's cache and gives it a fresh config entry."""
     # Pre-fill cache to simulate previous state
-    coord._cache = {"temp_strict_json": 20} 
-    return coord
-
-def test_validate_value_protocol_errors(coordinator):
-    """Test rejection of protocol specific error codes."""
-    # Test None (No data)
-    valid, val = coordinator._validate_value("temp_generic", None, 20)
-    assert valid is False
-    assert val is None
-
-    # Test 999 (Sensor Error)
-    valid, val = coordinator._validate_value("temp_generic", 999.0, 20)
-    assert valid is False
-    assert val is None
-
-def test_validate_value_json_priority(coordinator):
-    """Test that JSON limits defined in params_map take priority."""
-    slug = "temp_strict_json"
-    
-    # 1. Value inside JSON limits [10, 50]
-    valid, val = coordinator._validate_value(slug, 25, 20)
-    assert valid is True
-    assert val == 25
-
-    # 2. Value outside JSON limits (e.g., 60)
-    # Even if 60 is valid for generic temp (-20 to 100), JSON max is 50.
-    valid, val = coordinator._validate_value(slug, 60, 20)
-    assert valid is False
-    assert val is None
-
-def test_validate_value_generic_fallback(coordinator):
-    """Test that generic VALIDATION_RANGES are used when no JSON limits exist."""
-    slug = "temp_generic" # Contains "temp", so uses (-20, 100) range
-    
-    # 1. Valid generic value
-    valid, val = coordinator._validate_value(slug, 85, 20)
-    assert valid is True
-    assert val == 85
-
-    # 2. Invalid generic value (out of -20..100)
-    valid, val = coordinator._validate_value(slug, 150, 20)
-    assert valid is False
-    assert val is None
-
-def test_validate_value_pressure(coordinator):
-    """Test generic limits for pressure (0.0 to 4.0 bar)."""
-    slug = "pressure_bar"
-    
-    # Valid
-    valid, val = coordinator._validate_value(slug, 1.5, 1.0)
-    assert valid is True
-    
-    # Invalid (Safety valve open?)
-    valid, val = coordinator._validate_value(slug, 5.5, 1.0)
-    assert valid is False
+    coordinator._cache = SlugCache()
+    coordinator._cache.set("temp_strict_json", 20, stamp=0.0)
+    coordinator.config_entry = MagicMock()
+
+@pytest.mark.parametrize(
+    "slug,value,last,expected_valid,expected_val",
+    [
+        # Protocol errors: no data, sensor error code
+        ("temp_generic", None, 20, False, None),
+        ("temp_generic", 999.0, 20, False, None),
+        # Non-finite values (uninitialized probe), which would slip through
+        # the range comparisons, even within JSON limits
+        ("temp_strict_json", float("nan"), 20, False, None),
+        ("temp_strict_json", float("inf"), 20, False, None),
+        ("temp_strict_json", float("-inf"), 20, False, None),
+        ("pressure_bar", float("nan"), 1.0, False, None),
+        # JSON limits [10, 50] take priority: 60 is valid for generic temp
+        # (-20 to 100), but JSON max is 50
+        ("temp_strict_json", 25, 20, True, 25),
+        ("temp_strict_json", 60, 20, False, None),
+        # Generic VALIDATION_RANGES when no JSON limits exist ("temp": -20..100)
+        ("temp_generic", 85, 20, True, 85),
+        ("temp_generic", 150, 20, False, None),
+        ("temp_generic", float("nan"), 20, False, None),
+        ("temp_generic", float("inf"), 20, False, None),
+        # Generic limits for pressure (0.0 to 4.0 bar); over is a safety valve open?
+        ("pressure_bar", 1.5, 1.0, True, 1.5),
+        ("pressure_bar", 5.5, 1.0, False, None),
+    ],
+    ids=[
+        "none_rejected", "error_code_rejected",
+        "json_nan_rejected", "json_posinf_rejected", "json_neginf_rejected", "pressure_nan_rejected",
+        "json_in_range", "json_over_max",
+        "generic_ok", "generic_over", "generic_nan_rejected", "generic_posinf_rejected",
+        "pressure_ok", "pressure_over",
+    ],
+)
+def test_validate_value(coordinator, slug, value, last, expected_valid, expected_val):
+    """Test value sanitization against JSON limits and generic constraints."""
+    valid, val = coordinator._validate_value(slug, value, last)
+    assert valid is expected_valid
+    assert val == expected_val
+
+def test_slug_cache_ttl_and_eviction():
+    """Test freshness lookups, hit/miss counters and LRU eviction."""
+    cache = SlugCache(maxsize=2)
+    cache.set("a", 1, stamp=100.0)
+    cache.set("b", 2, stamp=100.0)
+
+    assert cache.lookup("a", ttl=10, now=105.0) == 1
+    assert cache.lookup("b", ttl=10, now=115.0) is None
+    assert cache.get("b") == 2  # Stale values stay available as fallback
+
+    cache.set("c", 3, stamp=120.0)  # Evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 2}
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+@pytest.mark.asyncio
+async def test_repeated_write_stops_on_ack(coordinator, monkeypatch):
+    """Test that a write is sent until acknowledged, then refreshed if never."""
+    monkeypatch.setattr("custom_components.plum_ecomax.coordinator.asyncio.sleep", AsyncMock())
+
+    monkeypatch.setattr(coordinator.device, "set_value", AsyncMock(side_effect=[False, True]))
+    await coordinator._perform_repeated_write("temp_generic", 21)
+    assert coordinator.device.set_value.await_count == 2
+    coordinator.config_entry.async_create_background_task.assert_not_called()
+
+    monkeypatch.setattr(coordinator.device, "set_value", AsyncMock(return_value=False))
+    monkeypatch.setattr(coordinator, "async_request_refresh", MagicMock())
+    await coordinator._perform_repeated_write("temp_generic", 21)
+    assert coordinator.device.set_value.await_count == 5
+    coordinator.config_entry.async_create_background_task.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_update_retries_slugs_missed_by_batch(coordinator, monkeypatch):
+    """Test that only the slugs the batch dropped are read one by one."""
+    slugs = ("temp_generic", "pressure_bar", "temp_strict_json")
+    monkeypatch.setattr(coordinator, "available_slugs", slugs)
+    monkeypatch.setattr(coordinator, "_poll_plan", tuple((slug, 60) for slug in slugs))
+    monkeypatch.setattr(coordinator.device, "get_values", AsyncMock(return_value={"temp_generic": 21}))
+    retried = {"pressure_bar": 5.5, "temp_strict_json": 30}
+    monkeypatch.setattr(
+        coordinator.device, "get_value", AsyncMock(side_effect=lambda slug, retries: retried[slug])
+    )
+
+    data = await coordinator._async_update_data()
+
+    coordinator.device.get_values.assert_awaited_once_with(list(slugs))
+    coordinator.device.get_value.assert_has_awaits(
+        [call("pressure_bar", retries=2), call("temp_strict_json", retries=2)], any_order=True
+    )
+    assert coordinator.device.get_value.await_count == 2
+    # The out of range pressure is rejected, the retried value goes through
+    assert data == {"temp_generic": 21, "temp_strict_json": 30}
+    assert coordinator._cache.get("temp_strict_json") == 30
+    assert coordinator._cache.get("pressure_bar") is None
+
+@pytest.mark.asyncio
+async def test_detection_batch_then_retry(coordinator, monkeypatch):
+    """Test that detection reads known slugs only and keeps retried ones."""
+    first, second, third = ALL_KNOWN_SLUGS[:3]
+    monkeypatch.setattr(
+        coordinator.device, "params_keys", frozenset({first, second, third, "not_a_platform_slug"})
+    )
+    monkeypatch.setattr(
+        coordinator.device, "get_values", AsyncMock(return_value={first: 40, third: 999.0})
+    )
+    monkeypatch.setattr(coordinator.device, "get_value", AsyncMock(return_value=55))
+    monkeypatch.setattr(coordinator, "available_slugs", ())
+    monkeypatch.setattr(coordinator, "_poll_plan", ())
+
+    await coordinator._detect_available_parameters()
+
+    coordinator.device.get_values.assert_awaited_once_with([first, second, third])
+    coordinator.device.get_value.assert_awaited_once_with(second, retries=5)
+    # The disconnected probe (999) is dropped
+    assert coordinator.available_slugs == (first, second)
+    assert [slug for slug, _ in coordinator._poll_plan] == [first, second]
+
+@pytest.mark.asyncio
+async def test_update_keeps_write_made_during_refresh(coordinator, monkeypatch):
+    """Test that a value read before an optimistic write never overwrites it."""
+    monkeypatch.setattr(coordinator, "available_slugs", ("temp_strict_json",))
+    monkeypatch.setattr(coordinator, "_poll_plan", (("temp_strict_json", 60),))
+    monkeypatch.setattr(coordinator, "async_set_updated_data", MagicMock())
+    monkeypatch.setattr(coordinator, "_perform_repeated_write", MagicMock())
+
+    async def read_then_write(slugs):
+        # The user writes while the device is answering with the old value
+        await coordinator.async_set_values({"temp_strict_json": 23.0})
+        return {"temp_strict_json": 20.0}
+
+    monkeypatch.setattr(coordinator.device, "get_values", read_then_write)
+    started = time.monotonic()
+    data = await coordinator._async_update_data()
+
+    assert data == {"temp_strict_json": 23.0}
+    assert coordinator._cache.get("temp_strict_json") == 23.0
+    assert coordinator._cache.stamp("temp_strict_json") > started
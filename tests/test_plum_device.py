@@ -0,0 +1,120 @@
+"""Unit tests for the low-level PlumDevice driver."""
+import pytest
+from unittest.mock import AsyncMock
+from custom_components.plum_ecomax.plum_device import DEST_ID, SOURCE_ID, PlumDevice, _build_codecs
+from custom_components.plum_ecomax.plum_protocol import BoilerFrame, compute_crc16
+
+@pytest.fixture
+def device():
+    return PlumDevice("127.0.0.1")
+
+def test_crc16_known_vector():
+    """Test the checksum against the CRC-16/XMODEM check value."""
+    assert compute_crc16(b"123456789") == 0x31C3
+    assert compute_crc16(b"") == 0x0000
+
+def test_encode_rejects_invalid_values(device):
+    """Test that unencodable values return None instead of raising."""
+    codec = _build_codecs({"p": {"type": "BYTE", "exponent": 0}})["p"]
+    assert device._encode(0, codec) == b"\x00"
+    assert device._encode(300, codec) is None
+    assert device._encode(float("nan"), codec) is None
+    assert device._encode("abc", codec) is None
+    assert device._decode(b"", codec) is None
+
+def test_read_frame_layout(device):
+    """Test the bytes of a read request as sent on the wire."""
+    payload = device._read_payload(42)
+    frame = BoilerFrame(1, 100, 0x43, payload).to_bytes()
+    assert frame[:8] == b"\x68\x0b\x00\x01\x00\x64\x00\x43"
+    assert frame[8:-3] == payload
+    assert compute_crc16(frame[1:-3]) == int.from_bytes(frame[-3:-1], "big")
+    assert frame[-1] == 0x16
+
+class FakeTransport:
+    """Stand-in connection answering reads from a script of raw values.
+
+    Each request consumes the next entry: bytes are sent back as the reply,
+    after a 7-byte header echoing the request, a BoilerFrame is sent back
+    as is and None simulates a lost exchange.
+    """
+
+    def __init__(self, answers):
+        self.answers = list(answers)
+        self.requested = []
+        self.connects = 0
+        self.connected = False
+
+    async def connect(self):
+        self.connects += 1
+        self.connected = True
+
+    async def close(self):
+        self.connected = False
+
+    async def request(self, frame, timeout=2.0):
+        self.requested.append(int.from_bytes(frame.data[4:6], "little"))
+        answer = self.answers.pop(0)
+        if answer is None or isinstance(answer, BoilerFrame):
+            return answer
+        return BoilerFrame(SOURCE_ID, DEST_ID, frame.func | 0x80, frame.data.ljust(7, b"\x00") + answer)
+
+BATCH_MAP = {
+    "temp_a": {"id": 1, "type": "BYTE", "exponent": 0},
+    "temp_b": {"id": 2, "type": "BYTE", "exponent": 0},
+    "temp_c": {"id": 3, "type": "BYTE", "exponent": 0},
+    "unsupported": {"id": 4, "type": "STRING", "exponent": 0},
+}
+
+@pytest.fixture
+def batch_device(device):
+    device.params_map = BATCH_MAP
+    device.params_keys = frozenset(BATCH_MAP)
+    device._codecs = _build_codecs(BATCH_MAP)
+    return device
+
+@pytest.mark.asyncio
+async def test_get_values_batch_on_one_connection(batch_device):
+    """Test that a batch shares one connection and skips unreadable slugs."""
+    fake = batch_device._transport = FakeTransport([b"\x15", b"\x16"])
+
+    values = await batch_device.get_values(["temp_a", "unsupported", "unknown", "temp_b"])
+
+    assert values == {"temp_a": 21, "temp_b": 22}
+    assert fake.requested == [1, 2]
+    assert fake.connects == 1
+    assert batch_device._data_cache == values
+
+@pytest.mark.asyncio
+async def test_get_values_stops_at_first_lost_exchange(batch_device):
+    """Test that a late answer is never credited to the next slug."""
+    # The answer to temp_b would arrive during the temp_c exchange
+    fake = batch_device._transport = FakeTransport([b"\x15", None, b"\x16"])
+
+    values = await batch_device.get_values(["temp_a", "temp_b", "temp_c"])
+
+    assert values == {"temp_a": 21}
+    assert fake.requested == [1, 2]
+    assert batch_device._data_cache == {"temp_a": 21}
+
+@pytest.mark.asyncio
+async def test_get_values_rejects_frames_not_replying(batch_device):
+    """Test that a frame for another address or command ends the batch."""
+    # A read reply addressed to the boiler, not to us
+    stray = BoilerFrame(DEST_ID, DEST_ID, 0xC3, b"\x00" * 7 + b"\x63")
+    fake = batch_device._transport = FakeTransport([b"\x15", stray, b"\x16"])
+
+    assert await batch_device.get_values(["temp_a", "temp_b", "temp_c"]) == {"temp_a": 21}
+    assert fake.requested == [1, 2]
+    assert not fake.connected
+
+@pytest.mark.asyncio
+async def test_set_value_needs_write_reply(batch_device, monkeypatch):
+    """Test that only a reply to the write command counts as acknowledged."""
+    monkeypatch.setattr("custom_components.plum_ecomax.plum_device.asyncio.sleep", AsyncMock())
+    nak = BoilerFrame(SOURCE_ID, DEST_ID, 0x7F, b"")
+    batch_device._transport = FakeTransport([nak, nak, nak])
+    assert await batch_device.set_value("temp_a", 21) is False
+
+    batch_device._transport = FakeTransport([nak, b""])
+    assert await batch_device.set_value("temp_a", 21) is True
@@ -0,0 +1,48 @@
+"""Unit tests for the AsyncPlumTransport frame parser."""
+import asyncio
+import pytest
+from custom_components.plum_ecomax.plum_protocol import BoilerFrame
+from custom_components.plum_ecomax.plum_transport import AsyncPlumTransport, PlumProtocol, ReceiveBuffer
+
+def feed(protocol, data):
+    """Simulates the event loop receiving `data` into the protocol."""
+    buf = protocol.get_buffer(len(data))
+    buf[:len(data)] = data
+    protocol.buffer_updated(len(data))
+
+@pytest.mark.asyncio
+async def test_read_frame_skips_noise_and_reassembles():
+    """Test that a frame split across chunks is rebuilt after leading noise."""
+    transport = AsyncPlumTransport("127.0.0.1", 8899)
+    protocol = transport._protocol = PlumProtocol(transport._buffer)
+    packet = BoilerFrame(100, 1, 0xC3, b"\x01\x02\x03").to_bytes()
+
+    # Noise, a corrupted frame, then the valid one in two pieces
+    corrupted = packet[:-3] + b"\x00\x00" + packet[-1:]
+    feed(protocol, b"\x00\x16" + corrupted + packet[:5])
+    asyncio.get_running_loop().call_soon(feed, protocol, packet[5:])
+
+    frame = await transport.read_frame(timeout=1.0)
+    assert frame == BoilerFrame(100, 1, 0xC3, b"\x01\x02\x03")
+
+    # Nothing else arrives: the read times out
+    assert await transport.read_frame(timeout=0.05) is None
+
+    # The peer closes the connection: the read fails fast
+    protocol.connection_lost(None)
+    assert not transport.connected
+    assert await transport.read_frame(timeout=1.0) is None
+
+def test_receive_buffer_compacts_when_full():
+    """Test that pending bytes move to the front once the end is reached."""
+    buf = ReceiveBuffer(size=8)
+    buf.writable()[:8] = b"abcdefgh"
+    buf.commit(8)
+    buf.consume(6)
+
+    space = buf.writable()
+    assert (buf.head, buf.tail, len(space)) == (0, 2, 6)
+    assert bytes(buf.view[:2]) == b"gh"
+
+    buf.consume(2)
+    assert len(buf) == 0 and len(buf.writable()) == 8
@@ -14,28 +14,34 @@ def dhw_entity():
         coordinator, "DHW", 
         "temp_curr", "temp_target", "temp_min", "temp_max", "mode_slug"
     )
+    # Values are snapshotted on coordinator updates, no HA state machine here
+    entity.async_write_ha_state = MagicMock()
     return entity
 
 def test_dhw_temperature_nan(dhw_entity):
     """Test NaN protection for current temperature."""
     # Valid
     dhw_entity.coordinator.data["temp_curr"] = 45.0
+    dhw_entity._handle_coordinator_update()
     assert dhw_entity.current_temperature == 45.0
     
     # NaN
     dhw_entity.coordinator.data["temp_curr"] = float('nan')
+    dhw_entity._handle_coordinator_update()
     assert dhw_entity.current_temperature is None
 
 def test_dhw_dynamic_limits(dhw_entity):
     """Test that min/max temp are fetched dynamically."""
     dhw_entity.coordinator.data["temp_min"] = 30
     dhw_entity.coordinator.data["temp_max"] = 55
-    
+    dhw_entity._handle_coordinator_update()
+
     assert dhw_entity.min_temp == 30.0
     assert dhw_entity.max_temp == 55.0
     
     # Fallback if data missing
     dhw_entity.coordinator.data["temp_min"] = None
+    dhw_entity._handle_coordinator_update()
     assert dhw_entity.min_temp == 20.0 # Default
 
 @pytest.mark.asyncio
@@ -48,3 +54,14 @@ async def test_set_operation_mode(dhw_entity):
     # HA 'Eco' -> Plum 2 (Auto)
     await dhw_entity.async_set_operation_mode(STATE_ECO)
     dhw_entity.coordinator.async_set_value.assert_called_with("mode_slug", 2)
+
+def test_dhw_mode_normalization(dhw_entity):
+    """Test that raw modes of any numeric form map to the same state."""
+    for raw in (2, 2.0, "2"):
+        dhw_entity.coordinator.data["mode_slug"] = raw
+        dhw_entity._handle_coordinator_update()
+        assert dhw_entity.current_operation == STATE_ECO
+
+    dhw_entity.coordinator.data["mode_slug"] = float("nan")
+    dhw_entity._handle_coordinator_update()
+    assert dhw_entity.current_operation == "off"